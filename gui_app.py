@@ -5,16 +5,170 @@ Includes intelligent sorting and grouping by identifier
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
-from PIL import Image, ImageTk
+from tkinter import ttk, filedialog, messagebox, scrolledtext, font as tkfont
+from PIL import Image, ImageDraw, ImageTk
+import hashlib
+import itertools
 import os
+import queue
+import re
+import stat
+import threading
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+from operator import itemgetter
 from image_uploader import ImageUploader, ImageIdentifier
 
+# Formatted group labels typed into the edit group dialog, e.g. MAP1, SPEC12
+_GROUP_RE = re.compile(r'(?:MAP|SPEC)(\d+)$', re.IGNORECASE)
+
+# Called once per row when the image list is rebuilt
+_format_group_label = ImageIdentifier.format_group_label
+
+# Identifiers the slide preview treats as spectrum images when auto-detecting layouts
+_SPECTRUM_LABELS = ImageIdentifier.SPECTRUM_IDENTIFIERS | {'Spectrum'}
+
+# Index fields shown in the image list, fetched in one call per row
+_row_fields = itemgetter('id', 'filename', 'format', 'width', 'height', 'size_bytes', 'added_date')
+
+
+def _image_identifier(img, default='Unknown'):
+    """Return an image's identifier, or default if it has none"""
+    metadata = img.get('metadata')
+    return metadata.get('identifier', default) if metadata else default
+
+
+def _file_mtime(filepath):
+    """Return a file's modification time, or None if it isn't an existing file"""
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    # Like os.path.isfile, so a directory counts as missing rather than
+    # failing to decode later
+    return st.st_mtime if stat.S_ISREG(st.st_mode) else None
+
+
+@lru_cache(maxsize=4096)
+def _format_added_date(added_minute):
+    """Format an ISO 'YYYY-MM-DDTHH:MM' prefix for the Date Added column"""
+    return datetime.fromisoformat(added_minute).strftime("%Y-%m-%d %H:%M")
+
+
+@lru_cache(maxsize=64)
+def _grid_cells(x, y, width, height, rows, cols, label_height, label_spacing):
+    """
+    Geometry of a rows x cols slide preview grid over an area.
+    
+    Returns (cell width, image height, cells), where cells holds each cell's
+    (x, y, label centre x, label centre y) in reading order.
+    """
+    cell_width = width / cols
+    cell_height = height / rows
+    image_height = cell_height - label_height - label_spacing  # Space for label
+    cells = []
+    for row in range(rows):
+        cell_y = y + row * cell_height
+        label_y = cell_y + image_height + label_spacing + label_height / 2
+        for col in range(cols):
+            cell_x = x + col * cell_width
+            cells.append((cell_x, cell_y, cell_x + cell_width / 2, label_y))
+    return cell_width, image_height, tuple(cells)
+
+
+def _stretch_to_8bit(img):
+    """Map a 32-bit integer or float image onto 8-bit grayscale by its value range"""
+    low, high = img.getextrema()
+    scale = 255 / (high - low) if high > low else 0
+    return img.point(lambda value: (value - low) * scale).convert('L')
+
+
+@lru_cache(maxsize=256)
+def _decode_slide_thumbnail(filepath, mtime, size, resample, reducing_gap):
+    """Decode a thumbnail fitting size; mtime keys out edited files. Treat the result as read-only."""
+    with Image.open(filepath) as img:
+        # Let the JPEG decoder scale down while decoding (no-op for other formats)
+        img.draft('RGB', (size[0] * 2, size[1] * 2))
+        if img.mode.startswith('I;16'):
+            img = img.convert('I')  # 16-bit TIFFs: thumbnail() can't resample these
+        img.thumbnail(size, resample, reducing_gap=reducing_gap)
+        img.load()
+    if img.mode in ('I', 'F'):
+        img = _stretch_to_8bit(img)
+    if img.mode not in ('RGB', 'RGBA'):
+        has_alpha = img.mode in ('LA', 'PA') or 'transparency' in img.info
+        img = img.convert('RGBA' if has_alpha else 'RGB')
+    return img
+
 
 class ImageUploaderGUI:
     """GUI Application for Image Uploader"""
     
+    # Number of rows inserted into the image list per idle callback
+    TREE_BATCH_SIZE = 200
+    
+    # Delay (ms) after the last keystroke before the search filter runs
+    SEARCH_DEBOUNCE_MS = 150
+    
+    # Preview panel thumbnail size and how many recent thumbnails to keep
+    PREVIEW_SIZE = (300, 300)
+    THUMBNAIL_CACHE_SIZE = 32
+    
+    # Preview thumbnails kept on disk between sessions (oldest pruned first)
+    THUMB_CACHE_LIMIT = 500
+    
+    # Resampling filter for preview thumbnails; after draft() and the
+    # reduce step in thumbnail() a 4-tap bicubic looks the same as LANCZOS
+    PREVIEW_FILTER = Image.Resampling.BICUBIC
+    
+    # thumbnail() first shrinks by an integer factor with a cheap box
+    # reduce, stopping at this multiple of the target size; 3.0 keeps the
+    # result indistinguishable from a full resample
+    PREVIEW_REDUCING_GAP = 3.0
+    
+    # Delay (ms) after the last selection change before the preview updates
+    PREVIEW_DEBOUNCE_MS = 80
+    
+    # Interval (ms) for checking whether a background preview load finished
+    PREVIEW_POLL_MS = 20
+    
+    # Worker threads used to copy and index uploaded images
+    UPLOAD_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+    
+    # Interval (ms) for draining upload progress from the workers
+    UPLOAD_POLL_MS = 50
+    
+    # Interval (ms) for checking whether a PowerPoint build has finished
+    GENERATE_POLL_MS = 100
+    
+    # Worker threads decoding thumbnails for the slide preview window
+    SLIDE_PREVIEW_WORKERS = os.cpu_count() or 1
+    
+    # Slide preview thumbnails are decoded at sizes rounded up to this step
+    # and cached, so reopening a preview reuses them
+    SLIDE_THUMB_BUCKET = 16
+    
+    # Slide preview cells are small enough that bilinear looks the same as
+    # the preview panel's bicubic filter
+    SLIDE_THUMB_FILTER = Image.Resampling.BILINEAR
+    
+    # Below this many pixels on the longer side, slide thumbnails are too
+    # small for the filter to show; nearest neighbour is used instead
+    SLIDE_THUMB_NEAREST_BELOW = 64
+    
+    # Box-reduce slide thumbnails to within twice the target before the
+    # bilinear pass; at slide cell sizes this matches the preview panel's 3.0
+    SLIDE_THUMB_REDUCING_GAP = 2.0
+    
+    # Slide frames built per idle callback when the preview window opens
+    SLIDE_FRAME_BATCH_SIZE = 10
+    
+    # Rendered slide previews (image plus labels) reused by later previews
+    SLIDE_PREVIEW_CACHE_SIZE = 32
+    
     def __init__(self, root):
         self.root = root
         self.root.title("PowerPoint Image Uploader")
@@ -24,7 +178,36 @@ class ImageUploaderGUI:
         self.uploader = ImageUploader()
         
         # Store thumbnail images to prevent garbage collection
-        self.thumbnail_images = {}
+        # (bounded LRU: {image_id: PhotoImage}, least recently used first;
+        # emptied whenever the preview panel is cleared)
+        self.thumbnail_images = OrderedDict()
+        
+        # Rendered slide previews kept across preview windows (bounded LRU:
+        # {key: (group images, layout profile, slide image, canvas texts)})
+        self._slide_preview_cache = OrderedDict()
+        
+        # Named fonts for slide preview text, created once so Tk resolves
+        # and measures each font a single time instead of per text item
+        self._slide_title_font = tkfont.Font(root=self.root, family='Arial', size=18, weight='bold')
+        self._slide_message_font = tkfont.Font(root=self.root, family='Arial', size=10)
+        self._slide_placeholder_font = tkfont.Font(root=self.root, family='Arial', size=8)
+        self._slide_label_font = tkfont.Font(root=self.root, family='Arial', size=6)
+        
+        # Preview thumbnails are decoded off the Tk thread
+        self._preview_executor = ThreadPoolExecutor(max_workers=2)
+        self._preview_future = None  # Pending load, cancelled when superseded
+        self._pending_preview_id = None  # Debounced selection-driven update
+        
+        # On-disk preview thumbnails, stored next to the image index
+        index_dir = os.path.dirname(os.path.abspath(self.uploader.index.index_file))
+        self.thumb_cache_dir = os.path.join(index_dir, '.thumbs')
+        os.makedirs(self.thumb_cache_dir, exist_ok=True)
+        
+        # Background job that fills the disk cache ahead of clicks; each
+        # refresh queues one job and bumps the generation to stop the last
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+        self._prefetch_future = None
+        self._prefetch_generation = 0
         
         # Track if preview is currently shown
         self.preview_visible = False
@@ -32,6 +215,32 @@ class ImageUploaderGUI:
         # Store custom layout profiles
         self.layout_profiles = {}  # {group_label: layout_config}
         
+        # Pending idle callback that is still filling the image list
+        self._populate_after_id = None
+        
+        # Display rows for every indexed image (rebuilt by refresh_image_list)
+        self._row_cache = None  # List of row tuples, in list_images() order
+        self._row_images = []   # Image dicts matching each cached row
+        self._row_search_text = []  # Lowercased filename + metadata per row
+        self._group_index = {}      # {group label: [row positions]}
+        self._ungrouped_rows = []   # Row positions of images without a group
+        
+        # {group label: [images]} for the layout designer and PowerPoint
+        # dialog, and the row cache it was built from
+        self._groups_dict_cache = {}
+        self._group_identifiers_cache = {}
+        self._group_summary_cache = {}
+        self._groups_dict_source = None
+        
+        # Treeview items created so far, attached or not: {iid: row tuple}
+        self._tree_items = {}
+        
+        # Last values tuple assigned to each filter combobox
+        self._combo_values = {}
+        
+        # Pending debounced search filter
+        self._search_after_id = None
+        
         # Configure style
         self.style = ttk.Style()
         self.style.theme_use('aqua' if os.name == 'posix' else 'clam')
@@ -40,6 +249,21 @@ class ImageUploaderGUI:
         self.setup_ui()
         self.refresh_image_list()
         self.update_stats()
+        
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+    
+    def on_close(self):
+        """Drop queued background thumbnail work and close the window"""
+        # Interpreter exit waits for executor jobs, so a long prefetch
+        # queue would otherwise hold the closed app open
+        self._prefetch_generation += 1
+        if self._prefetch_future is not None:
+            self._prefetch_future.cancel()
+        if self._preview_future is not None:
+            self._preview_future.cancel()
+        self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        self._preview_executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
     
     def setup_ui(self):
         """Setup the user interface"""
@@ -144,6 +368,7 @@ class ImageUploaderGUI:
         self.search_var = tk.StringVar()
         search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
         search_entry.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=2)
+        self.search_var.trace_add('write', self.on_search_changed)
         
         # Filter by group
         ttk.Label(search_frame, text="Group:").grid(row=2, column=0, sticky=tk.W, pady=(10, 2))
@@ -159,7 +384,7 @@ class ImageUploaderGUI:
         self.identifier_filter_var = tk.StringVar(value="All Types")
         self.identifier_combo = ttk.Combobox(search_frame, textvariable=self.identifier_filter_var,
                                             state='readonly', width=27)
-        self.identifier_combo['values'] = ["All Types"] + ImageIdentifier.ALL_IDENTIFIERS
+        self.identifier_combo['values'] = ["All Types"]  # Filled from the data by refresh_image_list
         self.identifier_combo.grid(row=5, column=0, sticky=(tk.W, tk.E), pady=2)
         self.identifier_combo.bind('<<ComboboxSelected>>', lambda e: self.apply_filters())
         
@@ -263,6 +488,12 @@ class ImageUploaderGUI:
         self.drag_start_item = None
         self.is_dragging = False
         
+        # List order captured when a drag begins (see _cache_drag_rows)
+        self._drag_items = ()     # All list items, top to bottom
+        self._drag_index = {}     # {item: position in _drag_items}
+        self._last_drag_selection = ()  # Selection last applied by the drag
+        self._selection_count = 0       # Size of the current tree selection
+        
         # Bind drag selection events
         self.tree.bind("<ButtonPress-1>", self.on_drag_start)
         self.tree.bind("<B1-Motion>", self.on_drag_motion)
@@ -308,23 +539,30 @@ class ImageUploaderGUI:
         folder_path = filedialog.askdirectory(title="Select Folder with Images")
         
         if folder_path:
-            # Find all image files in folder
-            image_files = []
-            for root, dirs, files in os.walk(folder_path):
-                for file in files:
-                    filepath = os.path.join(root, file)
-                    if self.uploader.is_supported_format(filepath):
-                        image_files.append(filepath)
-            
-            if image_files:
-                self.upload_images(image_files)
+            # Find image files in folder; uploading starts with the first one
+            # found while the rest of the tree is still being scanned
+            image_files = self.uploader.scan_folder(folder_path)
+            first_file = next(image_files, None)
+            
+            if first_file is not None:
+                self.upload_images(itertools.chain([first_file], image_files))
             else:
                 messagebox.showinfo("No Images", "No supported image files found in the selected folder.")
     
     def upload_images(self, filepaths):
-        """Upload multiple images"""
-        if not filepaths:
-            return
+        """
+        Upload multiple images.
+        
+        filepaths may be a list or any iterable (such as a folder scan);
+        for an iterable the progress bar stays indeterminate until the
+        number of files is known.
+        """
+        if isinstance(filepaths, (list, tuple)):
+            if not filepaths:
+                return
+            total = len(filepaths)
+        else:
+            total = None
         
         success_count = 0
         error_count = 0
@@ -341,123 +579,314 @@ class ImageUploaderGUI:
         
         progress_var = tk.DoubleVar()
         progress_bar = ttk.Progressbar(progress_window, variable=progress_var, 
-                                      maximum=len(filepaths), length=350)
+                                      maximum=total or 1, length=350,
+                                      mode='determinate' if total else 'indeterminate')
         progress_bar.pack(pady=10)
+        if total is None:
+            progress_bar.start()
         
         status_label = ttk.Label(progress_window, text="")
         status_label.pack(pady=5)
         
-        # Upload images
-        for i, filepath in enumerate(filepaths):
+        # Keep the user from editing the index while the upload runs
+        progress_window.protocol("WM_DELETE_WINDOW", lambda: None)
+        progress_window.grab_set()
+        
+        # Copy and index the files on worker threads; each finished upload
+        # reports (filepath, error) through the queue, which the Tk thread
+        # drains. Once every file is submitted, (None, count) follows.
+        results = queue.Queue()
+        copy_files = self.copy_files_var.get()
+        executor = ThreadPoolExecutor(max_workers=self.UPLOAD_WORKERS)
+        # Limits how many files are queued ahead of the workers
+        slots = threading.BoundedSemaphore(self.UPLOAD_WORKERS * 4)
+        
+        def report_upload(filepath, future):
+            slots.release()
+            results.put((filepath, future.exception()))
+        
+        def submit_uploads():
+            # Runs on its own thread so a long folder scan never blocks Tk
+            count = 0
             try:
-                filename = os.path.basename(filepath)
-                status_label.config(text=f"Uploading: {filename}")
-                progress_window.update()
+                for filepath in filepaths:
+                    slots.acquire()
+                    # The index is saved once, when the whole upload finishes
+                    future = executor.submit(self.uploader.upload_image, filepath,
+                                             copy_to_upload_dir=copy_files, save=False)
+                    future.add_done_callback(partial(report_upload, filepath))
+                    count += 1
+            finally:
+                executor.shutdown(wait=False)
+                results.put((None, count))
+        
+        threading.Thread(target=submit_uploads, daemon=True).start()
+        
+        def drain_progress_queue():
+            nonlocal success_count, error_count, total
+            last_path = None
+            while True:
+                try:
+                    filepath, error = results.get_nowait()
+                except queue.Empty:
+                    break
                 
-                self.uploader.upload_image(filepath, 
-                                          copy_to_upload_dir=self.copy_files_var.get())
-                success_count += 1
-            except Exception as e:
-                error_count += 1
-                errors.append(f"{os.path.basename(filepath)}: {str(e)}")
+                if filepath is None:
+                    # All files submitted; the bar can now show real progress
+                    if total is None:
+                        total = error
+                        progress_bar.stop()
+                        progress_bar.config(mode='determinate', maximum=max(total, 1))
+                        progress_var.set(success_count + error_count)
+                    continue
+                
+                last_path = filepath
+                if error is None:
+                    success_count += 1
+                else:
+                    error_count += 1
+                    errors.append(f"{os.path.basename(filepath)}: {str(error)}")
             
-            progress_var.set(i + 1)
-            progress_window.update()
-        
-        progress_window.destroy()
-        
-        # Show results
-        message = f"Successfully uploaded {success_count} image(s)."
-        if error_count > 0:
-            message += f"\n{error_count} error(s) occurred."
-            if errors:
-                error_details = "\n".join(errors[:5])
-                if len(errors) > 5:
-                    error_details += f"\n... and {len(errors) - 5} more errors"
-                message += f"\n\nErrors:\n{error_details}"
+            # Touch the widgets once per tick, however many uploads finished
+            if last_path is not None:
+                if total is not None:
+                    progress_var.set(success_count + error_count)
+                status_label.config(text=f"Uploaded: {os.path.basename(last_path)}")
+            
+            if total is None or success_count + error_count < total:
+                self.root.after(self.UPLOAD_POLL_MS, drain_progress_queue)
+            else:
+                finish_upload()
         
-        messagebox.showinfo("Upload Complete", message)
+        def finish_upload():
+            progress_window.grab_release()
+            progress_window.destroy()
+            
+            if success_count:
+                self.uploader.index.save_index_async()
+            
+            # Show results
+            message = f"Successfully uploaded {success_count} image(s)."
+            if error_count > 0:
+                message += f"\n{error_count} error(s) occurred."
+                if errors:
+                    error_details = "\n".join(errors[:5])
+                    if len(errors) > 5:
+                        error_details += f"\n... and {len(errors) - 5} more errors"
+                    message += f"\n\nErrors:\n{error_details}"
+            
+            messagebox.showinfo("Upload Complete", message)
+            
+            # Refresh display
+            self.refresh_image_list()
+            self.update_stats()
         
-        # Refresh display
-        self.refresh_image_list()
-        self.update_stats()
+        self.root.after(self.UPLOAD_POLL_MS, drain_progress_queue)
     
     def refresh_image_list(self):
         """Refresh the image list display with grouping and sorting"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Get sorted images
-        images = self.uploader.list_images()
+        # Rebuild the cached display rows from the (possibly changed) index
+        self._build_row_cache()
+        images = self._row_images
         
-        # Update group filter dropdown with all formatted labels that appear in the data
-        from image_uploader import ImageIdentifier
-        
-        # Collect all unique group labels that actually appear in the image list
+        # Collect the group labels, identifiers and formats that actually
+        # appear in the data, in one pass over the cached rows
         group_labels = set()
-        for img in images:
+        identifier_types = set()
+        format_types = set()
+        for img, row in zip(images, self._row_cache):
             metadata = img.get('metadata', {})
-            numerical_prefix = metadata.get('numerical_prefix')
-            identifier = metadata.get('identifier')
-            
-            if numerical_prefix:  # Only add if image has a group
-                formatted_label = ImageIdentifier.format_group_label(numerical_prefix, identifier)
-                if formatted_label:
-                    group_labels.add(formatted_label)
-        
-        # Sort the group labels
+            if metadata.get('numerical_prefix'):  # Only add if image has a group
+                group_labels.add(row[0])
+            if metadata.get('identifier'):
+                identifier_types.add(metadata['identifier'])
+            if img.get('format'):
+                format_types.add(img['format'])
+        
+        # Update group filter dropdown with all formatted labels
         sorted_group_labels = sorted(group_labels)
-        
         group_values = ["All Groups"] + sorted_group_labels
         if sorted_group_labels:  # Only add "Ungrouped" if there are any groups
             group_values.append("Ungrouped")
-        self.group_combo['values'] = group_values
-        
-        # Update identifier filter dropdown with all types that actually appear in the data
-        identifier_types = set()
-        for img in images:
-            identifier = img.get('metadata', {}).get('identifier')
-            if identifier:
-                identifier_types.add(identifier)
-        
-        sorted_identifiers = sorted(identifier_types)
-        self.identifier_combo['values'] = ["All Types"] + sorted_identifiers
-        
-        # Update format filter dropdown with all formats that actually appear in the data
-        format_types = set()
-        for img in images:
-            img_format = img.get('format')
-            if img_format:
-                format_types.add(img_format)
+        self._set_combo_values(self.group_combo, group_values)
         
-        sorted_formats = sorted(format_types)
-        self.format_combo['values'] = ["All Formats"] + sorted_formats
+        # Update identifier and format filter dropdowns
+        self._set_combo_values(self.identifier_combo, ["All Types"] + sorted(identifier_types))
+        self._set_combo_values(self.format_combo, ["All Formats"] + sorted(format_types))
         
         # Populate tree
-        for img in images:
+        self._purge_tree_items()
+        self._populate_tree(self._row_cache)
+        
+        # Warm the thumbnail cache for the (possibly changed) list
+        self._prefetch_thumbnails()
+    
+    def _set_combo_values(self, combo, values):
+        """Assign a combobox's dropdown values only if they changed"""
+        values = tuple(values)
+        if self._combo_values.get(combo) != values:
+            combo['values'] = values
+            self._combo_values[combo] = values
+    
+    def _build_row_cache(self):
+        """
+        Format the display row of every indexed image once.
+        
+        refresh_image_list (called after every change to the index) rebuilds
+        the cache; apply_filters only selects from it, so toggling filters
+        never re-formats group labels, sizes or dates.
+        """
+        images = self.uploader.list_images()
+        rows = []
+        search_text = []
+        group_index = {}
+        ungrouped_rows = []
+        add_row = rows.append
+        for position, img in enumerate(images):
+            image_id, filename, format_type, width, height, size_bytes, added_date = _row_fields(img)
             metadata = img.get('metadata', {})
             numerical_prefix = metadata.get('numerical_prefix')
             identifier = metadata.get('identifier', 'N/A')
             
             # Format group label (MAP1, MAP2 for map groups, 0001, 0002 for others)
-            from image_uploader import ImageIdentifier
-            group_label = ImageIdentifier.format_group_label(numerical_prefix, identifier) or 'N/A'
-            
-            dimensions = f"{img['width']}x{img['height']}"
-            size_kb = round(img['size_bytes'] / 1024, 2)
-            date_added = datetime.fromisoformat(img['added_date']).strftime("%Y-%m-%d %H:%M")
+            group_label = _format_group_label(numerical_prefix, identifier) or 'N/A'
             
-            self.tree.insert("", tk.END, values=(
+            add_row((
                 group_label,
-                img['id'],
+                image_id,
                 identifier,
-                img['filename'],
-                img['format'],
-                dimensions,
-                size_kb,
-                date_added
+                filename,
+                format_type,
+                f"{width}x{height}",
+                round(size_bytes / 1024, 2),
+                # Keyed by minute, so a batch uploaded together shares one entry
+                _format_added_date(added_date[:16])
             ))
+            
+            # Text searched by the filter box; the NUL separator keeps a query
+            # from matching across the filename/metadata boundary
+            search_text.append(f"{filename}\0{metadata}".lower())
+            
+            # Bucket rows by group so the group filter only visits its own rows
+            group_index.setdefault(group_label, []).append(position)
+            if not numerical_prefix:
+                ungrouped_rows.append(position)
+        
+        self._row_cache = rows
+        self._row_images = images
+        self._row_search_text = search_text
+        self._group_index = group_index
+        self._ungrouped_rows = ungrouped_rows
+    
+    def _populate_tree(self, rows):
+        """
+        Replace the image list contents with the given row tuples.
+        
+        Each image keeps one Treeview item (iid "img<id>") for the life of
+        the window. Rows that already have an item are reattached and
+        reordered in a single set_children call, so a filter change that
+        keeps most rows does little Tk work. Only missing or changed rows
+        are inserted or updated, the first batch right away and the rest
+        from idle callbacks so large indexes don't freeze the window.
+        All rows still become real items, so selection, drag-select and
+        Ctrl+Click keep working on every row.
+        """
+        # Stop filling in rows from a previous refresh
+        if self._populate_after_id is not None:
+            self.root.after_cancel(self._populate_after_id)
+            self._populate_after_id = None
+        
+        # Detached items would otherwise stay selected while hidden
+        selection = self.tree.selection()
+        if selection:
+            self.tree.selection_remove(*selection)
+        
+        tree_items = self._tree_items
+        keep = []
+        pending = []
+        for position, values in enumerate(rows):
+            iid = f"img{values[1]}"
+            shown = tree_items.get(iid)
+            if shown is not None:
+                keep.append(iid)
+            if shown != values:
+                pending.append((position, iid, values))
+        
+        # Detach everything else and put the kept rows in order (one Tcl call)
+        self.tree.set_children("", *keep)
+        
+        self._insert_tree_batch(pending, 0)
+    
+    def _insert_tree_batch(self, pending, start):
+        """Insert or update one batch of rows and schedule the next one"""
+        end = min(start + self.TREE_BATCH_SIZE, len(pending))
+        for position, iid, values in pending[start:end]:
+            if iid in self._tree_items:
+                self.tree.item(iid, values=values)
+            else:
+                # Earlier rows are all in place, so the row position is the index
+                self.tree.insert("", position, iid=iid, values=values)
+            self._tree_items[iid] = values
+        
+        if end < len(pending):
+            self._populate_after_id = self.root.after_idle(self._insert_tree_batch, pending, end)
+        else:
+            self._populate_after_id = None
+    
+    def _get_groups_dict(self):
+        """Return {group label: [images]} for all grouped images"""
+        # Rebuilt only when refresh_image_list has rebuilt the row cache,
+        # which happens after every change to the index
+        if self._row_cache is None:
+            self._build_row_cache()
+        if self._groups_dict_source is not self._row_cache:
+            groups_dict = {}
+            for img, row in zip(self._row_images, self._row_cache):
+                if img.get('metadata', {}).get('numerical_prefix'):
+                    groups_dict.setdefault(row[0], []).append(img)
+            self._groups_dict_cache = groups_dict
+            # Images arrive in index sort order, so first-seen order lists a
+            # group's identifiers in their predefined type order
+            self._group_identifiers_cache = {
+                label: list(dict.fromkeys(_image_identifier(img) for img in imgs))
+                for label, imgs in groups_dict.items()
+            }
+            self._group_summary_cache = {}
+            self._groups_dict_source = self._row_cache
+        return self._groups_dict_cache
+    
+    def _get_group_identifiers(self):
+        """Return {group label: identifiers in type order} for all grouped images"""
+        self._get_groups_dict()
+        return self._group_identifiers_cache
+    
+    def _get_group_summary(self, group_label):
+        """Return the image count and first filenames of a group, e.g. for slide previews"""
+        groups_dict = self._get_groups_dict()
+        summary = self._group_summary_cache.get(group_label)
+        if summary is None:
+            group_images = groups_dict[group_label]
+            num_images = len(group_images)
+            summary = f"{num_images} image{'s' if num_images != 1 else ''} | "
+            summary += f"Files: {', '.join(img['filename'] for img in group_images[:2])}"
+            if num_images > 2:
+                summary += f" ... +{num_images - 2} more"
+            self._group_summary_cache[group_label] = summary
+        return summary
+    
+    def _selected_rows(self):
+        """Return the cached row tuples of the selected items"""
+        # Avoids a Tk round-trip (and Tk's value conversion) per selected item
+        return [self._tree_items[item] for item in self.tree.selection()]
+    
+    def _purge_tree_items(self):
+        """Delete Treeview items for images that are no longer in the index"""
+        current = {f"img{row[1]}" for row in self._row_cache}
+        stale = [iid for iid in self._tree_items if iid not in current]
+        if stale:
+            self.tree.delete(*stale)
+            for iid in stale:
+                del self._tree_items[iid]
     
     def update_stats(self):
         """Update statistics display"""
@@ -480,80 +909,60 @@ class ImageUploaderGUI:
         self.stats_text.insert(1.0, stats_text)
         self.stats_text.config(state='disabled')
     
+    def on_search_changed(self, *args):
+        """Filter the list as the user types, once typing pauses"""
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(self.SEARCH_DEBOUNCE_MS, self.apply_filters)
+    
     def apply_filters(self):
         """Apply search query and filters"""
-        from image_uploader import ImageIdentifier
+        # A button click or combobox change supersedes a pending search
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+            self._search_after_id = None
         
         query = self.search_var.get().strip()
         group_filter = self.group_filter_var.get()
         identifier_filter = self.identifier_filter_var.get()
         format_filter = self.format_filter_var.get()
         
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        if self._row_cache is None:
+            self._build_row_cache()
         
-        # Get all images
-        images = self.uploader.list_images()
+        query_lower = query.lower()
         
-        # Apply filters
-        filtered_images = []
-        for img in images:
-            metadata = img.get('metadata', {})
-            numerical_prefix = metadata.get('numerical_prefix', '')
-            identifier = metadata.get('identifier', '')
-            img_format = img.get('format', '')
-            
-            # Format group label for comparison
-            group_label = ImageIdentifier.format_group_label(numerical_prefix, identifier)
-            
-            # Apply group filter
-            if group_filter != "All Groups":
-                if group_filter == "Ungrouped" and numerical_prefix:
-                    continue
-                elif group_filter != "Ungrouped" and group_label != group_filter:
-                    continue
+        # Apply group filter by picking the matching bucket of cached rows
+        if group_filter == "All Groups":
+            positions = range(len(self._row_cache))
+        elif group_filter == "Ungrouped":
+            positions = self._ungrouped_rows
+        else:
+            positions = self._group_index.get(group_filter, [])
+        
+        # Apply the remaining filters to those rows
+        row_cache = self._row_cache
+        search_texts = self._row_search_text
+        rows = []
+        for position in positions:
+            row = row_cache[position]
             
             # Apply identifier filter
-            if identifier_filter != "All Types" and identifier != identifier_filter:
+            if identifier_filter != "All Types" and row[2] != identifier_filter:
                 continue
             
             # Apply format filter
-            if format_filter != "All Formats" and img_format != format_filter:
+            if format_filter != "All Formats" and row[4] != format_filter:
                 continue
             
             # Apply text search
-            if query:
-                query_lower = query.lower()
-                if not (query_lower in img['filename'].lower() or 
-                       query_lower in str(metadata).lower()):
-                    continue
+            if query_lower and query_lower not in search_texts[position]:
+                continue
             
-            filtered_images.append(img)
+            rows.append(row)
         
         # Display filtered results
-        for img in filtered_images:
-            metadata = img.get('metadata', {})
-            numerical_prefix = metadata.get('numerical_prefix')
-            identifier = metadata.get('identifier', 'N/A')
-            
-            # Format group label
-            group_label = ImageIdentifier.format_group_label(numerical_prefix, identifier) or 'N/A'
-            
-            dimensions = f"{img['width']}x{img['height']}"
-            size_kb = round(img['size_bytes'] / 1024, 2)
-            date_added = datetime.fromisoformat(img['added_date']).strftime("%Y-%m-%d %H:%M")
-            
-            self.tree.insert("", tk.END, values=(
-                group_label,
-                img['id'],
-                identifier,
-                img['filename'],
-                img['format'],
-                dimensions,
-                size_kb,
-                date_added
-            ))
+        self._populate_tree(rows)
     
     def clear_filters(self):
         """Clear all filters and show all images"""
@@ -561,7 +970,7 @@ class ImageUploaderGUI:
         self.group_filter_var.set("All Groups")
         self.identifier_filter_var.set("All Types")
         self.format_filter_var.set("All Formats")
-        self.refresh_image_list()
+        self.apply_filters()
     
     def edit_group(self):
         """Allow user to manually edit the group assignment of selected image(s)"""
@@ -571,10 +980,7 @@ class ImageUploaderGUI:
             return
         
         # Get selected image IDs
-        selected_ids = []
-        for item in selection:
-            values = self.tree.item(item)['values']
-            selected_ids.append(int(values[1]))  # ID is column index 1
+        selected_ids = [row[1] for row in self._selected_rows()]  # ID is column index 1
         
         # Create edit dialog
         edit_window = tk.Toplevel(self.root)
@@ -591,9 +997,7 @@ class ImageUploaderGUI:
         
         # Get identifier type of first selected image to provide better guidance
         first_img = self.uploader.index.get_image(selected_ids[0])
-        identifier = first_img.get('metadata', {}).get('identifier', '') if first_img else ''
-        
-        from image_uploader import ImageIdentifier
+        identifier = _image_identifier(first_img, '') if first_img else ''
         
         # Group label input
         group_frame = ttk.Frame(main_frame)
@@ -617,7 +1021,7 @@ class ImageUploaderGUI:
         # Determine example text based on identifier type
         if identifier == 'Spectrum' or identifier in ImageIdentifier.SPECTRUM_IDENTIFIERS:
             auto_format = "SPEC1, SPEC2, etc."
-        elif identifier == 'Maps' or identifier in ['Map', 'Maps', 'Electron Image']:
+        elif identifier == 'Maps' or identifier in ImageIdentifier.MAP_IDENTIFIERS:
             auto_format = "MAP1, MAP2, etc."
         else:
             auto_format = "0001, 0002, etc."
@@ -643,10 +1047,8 @@ class ImageUploaderGUI:
                 new_group = None
             else:
                 # Accept any input - parse for numeric or use as-is
-                import re
-                
                 # Try to extract number from formatted labels like MAP1, SPEC1, etc.
-                formatted_match = re.match(r'(?:MAP|SPEC|map|spec)(\d+)$', new_group_input, re.IGNORECASE)
+                formatted_match = _GROUP_RE.match(new_group_input)
                 if formatted_match:
                     # Extract the number and pad with zeros (for auto-formatting)
                     new_group = formatted_match.group(1).zfill(4)
@@ -661,20 +1063,24 @@ class ImageUploaderGUI:
                         return
                     new_group = new_group_input
             
-            # Update each selected image
+            # Only images whose value actually differs need updating
+            changed = []
             for img_id in selected_ids:
                 img = self.uploader.index.get_image(img_id)
-                if img:
-                    img['metadata']['numerical_prefix'] = new_group
-            
-            # Save changes
-            self.uploader.index.save_index()
-            
-            # Refresh display
-            self.refresh_image_list()
-            self.update_stats()
+                if img and img['metadata'].get('numerical_prefix') != new_group:
+                    changed.append(img)
+            
+            if changed:
+                # Update each changed image; the index is saved once at the end
+                with self.uploader.index.bulk_update(save_async=True):
+                    for img in changed:
+                        img['metadata']['numerical_prefix'] = new_group
+                
+                # Refresh display
+                self.refresh_image_list()
+                self.update_stats()
             
-            messagebox.showinfo("Success", f"Updated group for {len(selected_ids)} image(s) to '{new_group if new_group else 'No Group'}'.")
+            messagebox.showinfo("Success", f"Updated group for {len(changed)} image(s) to '{new_group if new_group else 'No Group'}'.")
             edit_window.destroy()
         
         ttk.Button(button_frame, text="Apply", command=apply_changes).pack(side=tk.LEFT, padx=5)
@@ -691,10 +1097,7 @@ class ImageUploaderGUI:
             return
         
         # Get selected image IDs
-        selected_ids = []
-        for item in selection:
-            values = self.tree.item(item)['values']
-            selected_ids.append(int(values[1]))  # ID is column index 1
+        selected_ids = [row[1] for row in self._selected_rows()]  # ID is column index 1
         
         # Create edit dialog
         edit_window = tk.Toplevel(self.root)
@@ -709,8 +1112,6 @@ class ImageUploaderGUI:
         ttk.Label(main_frame, text=f"Editing {len(selected_ids)} image(s)", 
                  font=('Helvetica', 12, 'bold')).pack(pady=(0, 10))
         
-        from image_uploader import ImageIdentifier
-        
         # Type selection
         type_frame = ttk.Frame(main_frame)
         type_frame.pack(fill=tk.X, pady=10)
@@ -728,7 +1129,7 @@ class ImageUploaderGUI:
         for img_id in selected_ids:
             img = self.uploader.index.get_image(img_id)
             if img:
-                current_type = img.get('metadata', {}).get('identifier', '')
+                current_type = _image_identifier(img, '')
                 if current_type:
                     current_types.add(current_type)
         
@@ -763,24 +1164,28 @@ class ImageUploaderGUI:
                 messagebox.showwarning("No Type Selected", "Please select an image type.")
                 return
             
-            if new_type not in ImageIdentifier.ALL_IDENTIFIERS:
+            if new_type not in ImageIdentifier.ALL_IDENTIFIERS_SET:
                 messagebox.showerror("Invalid Type", "Selected type is not valid.")
                 return
             
-            # Update each selected image
+            # Only images whose value actually differs need updating
+            changed = []
             for img_id in selected_ids:
                 img = self.uploader.index.get_image(img_id)
-                if img:
-                    img['metadata']['identifier'] = new_type
-            
-            # Save changes
-            self.uploader.index.save_index()
-            
-            # Refresh display
-            self.refresh_image_list()
-            self.update_stats()
+                if img and img['metadata'].get('identifier') != new_type:
+                    changed.append(img)
+            
+            if changed:
+                # Update each changed image; the index is saved once at the end
+                with self.uploader.index.bulk_update(save_async=True):
+                    for img in changed:
+                        img['metadata']['identifier'] = new_type
+                
+                # Refresh display
+                self.refresh_image_list()
+                self.update_stats()
             
-            messagebox.showinfo("Success", f"Updated image type for {len(selected_ids)} image(s) to '{new_type}'.")
+            messagebox.showinfo("Success", f"Updated image type for {len(changed)} image(s) to '{new_type}'.")
             edit_window.destroy()
         
         ttk.Button(button_frame, text="Apply", command=apply_changes).pack(side=tk.LEFT, padx=5)
@@ -794,6 +1199,11 @@ class ImageUploaderGUI:
         self.preview_label.config(text="Double-click an image to preview", image="")
         self.preview_close_btn.pack_forget()  # Hide the close button
         self.preview_visible = False  # Mark preview as hidden
+        self._cancel_preview_load()  # Drop any preview still loading
+        self.thumbnail_images.clear()  # Release the cached Tk images
+        if self._pending_preview_id is not None:
+            self.root.after_cancel(self._pending_preview_id)
+            self._pending_preview_id = None
     
     def on_single_click(self, event):
         """Handle single-click to update preview if already visible"""
@@ -802,95 +1212,266 @@ class ImageUploaderGUI:
             return
         
         # Small delay to allow tree selection to update
-        self.root.after(10, self._update_preview_from_click)
+        self._schedule_preview_update()
     
     def on_selection_change(self, event):
         """Handle selection change (from arrow keys or any other navigation)"""
-        # Update selection status
-        selection = self.tree.selection()
-        if len(selection) > 1:
-            self.selection_status_label.config(text=f"{len(selection)} images selected")
+        # Update selection status; during a drag the size is known from the
+        # range on_drag_motion applied, so skip fetching the whole selection
+        if self.is_dragging:
+            count = len(self._last_drag_selection)
         else:
-            self.selection_status_label.config(text="")
+            count = len(self.tree.selection())
+        self._set_selection_count(count)
         
-        # Only update preview if it's already visible
-        if not self.preview_visible:
+        # Only update preview if it's already visible, and not while a drag
+        # is still changing the selection (on_drag_end updates it once)
+        if not self.preview_visible or self.is_dragging:
             return
         
         # Update preview with small delay
-        self.root.after(10, self._update_preview_from_click)
+        self._schedule_preview_update()
+    
+    def _set_selection_count(self, count):
+        """Show how many images are selected, touching the label only on change"""
+        if count == self._selection_count:
+            return
+        self._selection_count = count
+        self.selection_status_label.config(text=f"{count} images selected" if count > 1 else "")
+    
+    def _schedule_preview_update(self):
+        """Update the preview once the selection settles (e.g. after key repeat)"""
+        if self._pending_preview_id is not None:
+            self.root.after_cancel(self._pending_preview_id)
+        self._pending_preview_id = self.root.after(self.PREVIEW_DEBOUNCE_MS, self._update_preview_from_click)
     
     def _update_preview_from_click(self):
         """Update preview after selection change"""
+        self._pending_preview_id = None
+        self._show_preview(reveal=False)
+    
+    def on_double_click(self, event):
+        """Handle image double-click to show preview"""
+        self._show_preview(reveal=True)
+    
+    def _show_preview(self, reveal):
+        """
+        Show the first selected image in the preview panel.
+        
+        Recently shown thumbnails are reused; otherwise the thumbnail is
+        read from the disk cache or decoded and resized on a worker thread
+        so large files don't freeze the UI.
+        reveal=True (double-click) also shows the close button.
+        """
         selection = self.tree.selection()
         if not selection:
             return
         
         # Get selected image ID
-        item = self.tree.item(selection[0])
-        image_id = int(item['values'][1])  # ID is in column index 1
+        image_id = self._tree_items[selection[0]][1]  # ID is in column index 1
         
         # Get image info
         img_info = self.uploader.get_image_info(image_id)
         if not img_info:
             return
         
-        # Load and display thumbnail
+        # Whatever happens below replaces any preview still loading
+        self._cancel_preview_load()
+        
+        photo = self.thumbnail_images.get(image_id)
+        if photo is not None:
+            self.thumbnail_images.move_to_end(image_id)
+            self._set_preview_image(photo, reveal)
+            return
+        
+        filepath = img_info['filepath']
+        if not os.path.isfile(filepath):
+            self._set_preview_message("Image file not found", reveal)
+            return
+        
+        # Load in the background; the newest request wins
+        future = self._preview_executor.submit(self._load_preview_thumbnail, filepath)
+        self._preview_future = future
+        self.root.after(self.PREVIEW_POLL_MS, self._poll_preview, future, image_id, reveal)
+    
+    def _cancel_preview_load(self):
+        """Drop the pending background preview load, if any"""
+        # A job that has not started yet is skipped entirely; one already
+        # running finishes, but _poll_preview ignores its result
+        if self._preview_future is not None:
+            self._preview_future.cancel()
+            self._preview_future = None
+    
+    def _load_preview_thumbnail(self, filepath):
+        """Get the preview thumbnail for an image (runs on a worker thread)"""
+        cache_path = self._get_cached_thumb(filepath)
+        
+        # Cache hit: a small PNG instead of decoding the original
         try:
-            filepath = img_info['filepath']
-            if os.path.exists(filepath):
-                image = Image.open(filepath)
-                
-                # Create thumbnail
-                image.thumbnail((300, 300), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(image)
-                
-                # Store reference and update label
-                self.thumbnail_images[image_id] = photo
-                self.preview_label.config(image=photo, text="")
-            else:
-                self.preview_label.config(text="Image file not found", image="")
-        except Exception as e:
-            self.preview_label.config(text=f"Error loading preview: {str(e)}", image="")
+            with Image.open(cache_path) as image:
+                image.load()
+            os.utime(cache_path)  # Mark as recently used for pruning
+            return image
+        except (OSError, ValueError):
+            pass
+        
+        image = self._make_thumbnail(filepath)
+        self._store_cached_thumb(image, cache_path)
+        return image
     
-    def on_double_click(self, event):
-        """Handle image double-click to show preview"""
-        selection = self.tree.selection()
-        if not selection:
+    def _make_thumbnail(self, filepath):
+        """Decode and shrink an image to preview size"""
+        with Image.open(filepath) as image:
+            # Let the JPEG decoder scale down while decoding (no-op for other
+            # formats); twice the preview size leaves detail for the resize
+            width, height = self.PREVIEW_SIZE
+            image.draft('RGB', (width * 2, height * 2))
+            if image.mode.startswith('I;16'):
+                image = image.convert('I')  # 16-bit TIFFs: thumbnail() can't resample these
+            image.thumbnail(self.PREVIEW_SIZE, self.PREVIEW_FILTER, reducing_gap=self.PREVIEW_REDUCING_GAP)
+            image.load()
+        if image.mode in ('I', 'F'):
+            image = _stretch_to_8bit(image)
+        return image
+    
+    def _load_slide_thumbnail(self, filepath, mtime, size):
+        """Get a slide preview thumbnail, ready to paste (runs on a worker thread)"""
+        # Round the size up to a 16px bucket so slightly different boxes (and
+        # reopened previews) share one decoded image, then fit the exact box
+        step = self.SLIDE_THUMB_BUCKET
+        bucket = (-(-size[0] // step) * step, -(-size[1] // step) * step)
+        if max(size) < self.SLIDE_THUMB_NEAREST_BELOW:
+            resample = Image.Resampling.NEAREST
+        else:
+            resample = self.SLIDE_THUMB_FILTER
+        img = None
+        if bucket[0] <= self.PREVIEW_SIZE[0] and bucket[1] <= self.PREVIEW_SIZE[1]:
+            # The preview panel's disk-cached thumbnail (usually prefetched)
+            # is big enough, and far cheaper to decode than the original
+            try:
+                cache_path = self._get_cached_thumb(filepath)
+                if os.path.exists(cache_path):
+                    img = _decode_slide_thumbnail(cache_path, mtime, bucket,
+                                                  resample, self.SLIDE_THUMB_REDUCING_GAP)
+            except OSError:
+                pass  # Pruned meanwhile; decode the original instead
+        if img is None:
+            img = _decode_slide_thumbnail(filepath, mtime, bucket,
+                                          resample, self.SLIDE_THUMB_REDUCING_GAP)
+        if img.width > size[0] or img.height > size[1]:
+            # resize() returns a new image, so the cached one is left intact
+            # without copying it first
+            scale = min(size[0] / img.width, size[1] / img.height)
+            fitted = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+            img = img.resize(fitted, resample)
+        return img
+    
+    def _prefetch_thumbnails(self):
+        """Queue disk-cache thumbnails for listed images that don't have one"""
+        # A running job stops before its next image; a queued one never starts
+        self._prefetch_generation += 1
+        if self._prefetch_future is not None:
+            self._prefetch_future.cancel()
+        
+        # Stop at the cache limit, or prefetching would prune its own work
+        filepaths = [img['filepath'] for img in self._row_images[:self.THUMB_CACHE_LIMIT]]
+        self._prefetch_future = self._prefetch_executor.submit(
+            self._prefetch_thumbnail_list, self._prefetch_generation, filepaths)
+    
+    def _prefetch_thumbnail_list(self, generation, filepaths):
+        """Create disk-cache thumbnails in order until superseded (runs on the prefetch thread)"""
+        for filepath in filepaths:
+            if generation != self._prefetch_generation:
+                return
+            self._prefetch_thumbnail(filepath)
+    
+    def _prefetch_thumbnail(self, filepath):
+        """Create the disk-cache thumbnail for one image"""
+        try:
+            cache_path = self._get_cached_thumb(filepath)
+            if not os.path.exists(cache_path):
+                self._store_cached_thumb(self._make_thumbnail(filepath), cache_path)
+        except Exception:
+            # Best effort; a real preview of this image reports the problem
+            pass
+    
+    def _get_cached_thumb(self, filepath):
+        """Return the disk cache path for an image's preview thumbnail"""
+        # Key on path, mtime and size so an edited file gets a fresh thumbnail
+        st = os.stat(filepath)
+        key = hashlib.blake2b(f"{filepath}:{st.st_mtime}:{st.st_size}".encode(),
+                              digest_size=16).hexdigest()
+        return os.path.join(self.thumb_cache_dir, key + '.png')
+    
+    def _store_cached_thumb(self, image, cache_path):
+        """Save a preview thumbnail to the disk cache and prune old entries"""
+        # Write under a temporary name so a concurrent reader never sees a
+        # partial file
+        tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+        try:
+            image.save(tmp_path, 'PNG')
+            os.replace(tmp_path, cache_path)
+        except (OSError, ValueError):
+            # Modes PNG can't store (e.g. CMYK) are simply not cached
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             return
         
-        # Get selected image ID (now in column index 1)
-        item = self.tree.item(selection[0])
-        image_id = int(item['values'][1])  # ID is now the second column
+        try:
+            with os.scandir(self.thumb_cache_dir) as entries:
+                thumbs = [(entry.stat().st_mtime, entry.path)
+                          for entry in entries if entry.name.endswith('.png')]
+        except OSError:
+            return
+        if len(thumbs) > self.THUMB_CACHE_LIMIT:
+            thumbs.sort()
+            for _, path in thumbs[:len(thumbs) - self.THUMB_CACHE_LIMIT]:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+    
+    def _poll_preview(self, future, image_id, reveal):
+        """Install a background-loaded thumbnail once it is ready (Tk thread)"""
+        if not future.done():
+            self.root.after(self.PREVIEW_POLL_MS, self._poll_preview, future, image_id, reveal)
+            return
         
-        # Get image info
-        img_info = self.uploader.get_image_info(image_id)
-        if not img_info:
+        # Ignore results for a selection that has since changed
+        if future is not self._preview_future:
             return
+        self._preview_future = None
         
-        # Load and display thumbnail
         try:
-            filepath = img_info['filepath']
-            if os.path.exists(filepath):
-                image = Image.open(filepath)
-                
-                # Create thumbnail
-                image.thumbnail((300, 300), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(image)
-                
-                # Store reference and update label
-                self.thumbnail_images[image_id] = photo
-                self.preview_label.config(image=photo, text="")
-                
-                # Show the close button and mark preview as visible
-                self.preview_close_btn.pack(side=tk.TOP, anchor=tk.NE, padx=2, pady=2)
-                self.preview_visible = True
-            else:
-                self.preview_label.config(text="Image file not found", image="")
-                self.preview_close_btn.pack_forget()
-                self.preview_visible = False
+            image = future.result()
         except Exception as e:
-            self.preview_label.config(text=f"Error loading preview: {str(e)}", image="")
+            self._set_preview_message(f"Error loading preview: {str(e)}", reveal)
+            return
+        
+        # PhotoImage must be created on the Tk thread
+        photo = ImageTk.PhotoImage(image)
+        self.thumbnail_images[image_id] = photo
+        while len(self.thumbnail_images) > self.THUMBNAIL_CACHE_SIZE:
+            self.thumbnail_images.popitem(last=False)
+        
+        self._set_preview_image(photo, reveal)
+    
+    def _set_preview_image(self, photo, reveal):
+        """Display a thumbnail in the preview panel"""
+        self.preview_label.config(image=photo, text="")
+        
+        if reveal:
+            # Show the close button and mark preview as visible
+            self.preview_close_btn.pack(side=tk.TOP, anchor=tk.NE, padx=2, pady=2)
+            self.preview_visible = True
+    
+    def _set_preview_message(self, message, reveal):
+        """Display a text message instead of a thumbnail"""
+        self.preview_label.config(text=message, image="")
+        
+        if reveal:
             self.preview_close_btn.pack_forget()
             self.preview_visible = False
     
@@ -923,40 +1504,37 @@ class ImageUploaderGUI:
                 self.is_dragging = True
             
             if self.is_dragging:
-                # Get all items between start and current position
-                start_y = self.drag_start_y
-                end_y = event.y
-                
-                # Ensure start_y is always less than end_y
-                if start_y > end_y:
-                    start_y, end_y = end_y, start_y
+                if not self._drag_index:
+                    self._cache_drag_rows()
                 
-                # Get all visible items in the tree
-                children = self.tree.get_children()
-                selected_items = []
-                
-                for child in children:
-                    # Get the bounding box of the item
-                    try:
-                        bbox = self.tree.bbox(child)
-                        if bbox:  # bbox returns None if item is not visible
-                            item_y = bbox[1] + bbox[3] / 2  # Middle of the item
-                            # Check if item is within selection range
-                            if start_y <= item_y <= end_y:
-                                selected_items.append(child)
-                    except:
-                        # If bbox fails, skip this item
-                        continue
+                # Select every item from the one the drag started on to the
+                # one under the pointer; off-list positions keep the last range
+                current_item = self.tree.identify_row(event.y)
+                start = self._drag_index.get(self.drag_start_item)
+                end = self._drag_index.get(current_item)
+                if start is None or end is None:
+                    return
+                if start > end:
+                    start, end = end, start
+                selected_items = self._drag_items[start:end + 1]
                 
-                # Update selection
-                if selected_items:
+                # Update selection only when the range covers different rows
+                if selected_items != self._last_drag_selection:
+                    self._last_drag_selection = selected_items
                     self.tree.selection_set(selected_items)
     
+    def _cache_drag_rows(self):
+        """Record the list order once per drag so ranges are plain slices"""
+        self._drag_items = self.tree.get_children()
+        self._drag_index = {item: i for i, item in enumerate(self._drag_items)}
+    
     def on_drag_end(self, event):
         """Handle the end of drag selection"""
         if self.is_dragging:
-            # Dragging completed, selection is already set in on_drag_motion
-            pass
+            # Dragging completed, selection is already set in on_drag_motion;
+            # the preview was held back during the drag, so update it now
+            if self.preview_visible:
+                self._schedule_preview_update()
         else:
             # Just a click, not a drag - handle normal click selection
             item = self.tree.identify_row(event.y)
@@ -976,17 +1554,13 @@ class ImageUploaderGUI:
                     # Normal click - select just this item
                     self.tree.selection_set(item)
         
-        # Update selection status
-        selection = self.tree.selection()
-        if len(selection) > 1:
-            self.selection_status_label.config(text=f"{len(selection)} images selected")
-        else:
-            self.selection_status_label.config(text="")
-        
-        # Reset drag state
+        # Reset drag state (the selection status follows <<TreeviewSelect>>)
         self.drag_start_item = None
         self.drag_start_y = None
         self.is_dragging = False
+        self._drag_items = ()
+        self._drag_index = {}
+        self._last_drag_selection = ()
     
     def show_details(self):
         """Show detailed information about selected image(s)"""
@@ -999,8 +1573,7 @@ class ImageUploaderGUI:
         details_window = tk.Toplevel(self.root)
         if len(selection) == 1:
             # Single selection - get specific info
-            item = self.tree.item(selection[0])
-            image_id = int(item['values'][1])
+            image_id = self._tree_items[selection[0]][1]
             img_info = self.uploader.get_image_info(image_id)
             if not img_info:
                 messagebox.showerror("Error", "Image information not found.")
@@ -1023,11 +1596,7 @@ class ImageUploaderGUI:
         
         # Format details for single or multiple images
         if len(selection) == 1:
-            # Single image details (existing behavior)
-            item = self.tree.item(selection[0])
-            image_id = int(item['values'][1])
-            img_info = self.uploader.get_image_info(image_id)
-            
+            # Single image details (existing behavior; img_info looked up above)
             details_str = f"Image Details\n{'='*50}\n\n"
             for key, value in img_info.items():
                 if key == 'metadata':
@@ -1044,36 +1613,26 @@ class ImageUploaderGUI:
             details_str = f"Summary of {len(selection)} Selected Images\n{'='*50}\n\n"
             
             # Collect statistics
-            total_size = 0
-            formats = {}
-            identifiers = {}
-            groups = {}
-            
-            for item in selection:
-                values = self.tree.item(item)['values']
-                image_id = int(values[1])
-                img_info = self.uploader.get_image_info(image_id)
+            get_info = self.uploader.get_image_info
+            looked_up = ((values[0], get_info(values[1])) for values in self._selected_rows())
+            selected = [(group, img_info) for group, img_info in looked_up if img_info]
+            total_size = sum(img_info['size_bytes'] for _, img_info in selected)
+            formats = Counter(img_info['format'] for _, img_info in selected)
+            identifiers = Counter()
+            groups = Counter()
+            
+            # Build per-file lines in a list; joining once avoids quadratic string growth
+            lines = []
+            for group, img_info in selected:
+                identifier = _image_identifier(img_info, 'N/A')
+                identifiers[identifier] += 1
+                groups[group] += 1
                 
-                if img_info:
-                    # Size
-                    total_size += img_info['size_bytes']
-                    
-                    # Format
-                    fmt = img_info['format']
-                    formats[fmt] = formats.get(fmt, 0) + 1
-                    
-                    # Identifier
-                    identifier = img_info.get('metadata', {}).get('identifier', 'N/A')
-                    identifiers[identifier] = identifiers.get(identifier, 0) + 1
-                    
-                    # Group
-                    group = values[0]  # Group column
-                    groups[group] = groups.get(group, 0) + 1
-                    
-                    # Add individual file info
-                    details_str += f"• {img_info['filename']}\n"
-                    details_str += f"  Type: {identifier}, Group: {group}\n"
-                    details_str += f"  Size: {round(img_info['size_bytes']/1024, 2)} KB\n\n"
+                # Add individual file info
+                lines.append(f"• {img_info['filename']}\n"
+                             f"  Type: {identifier}, Group: {group}\n"
+                             f"  Size: {round(img_info['size_bytes']/1024, 2)} KB\n\n")
+            details_str += ''.join(lines)
             
             # Add summary statistics
             details_str += f"\nSummary Statistics:\n{'-'*30}\n"
@@ -1108,9 +1667,8 @@ class ImageUploaderGUI:
         
         # Get selected image IDs and filenames
         selected_items = []
-        for item in selection:
-            values = self.tree.item(item)['values']
-            image_id = int(values[1])  # ID is column index 1
+        for values in self._selected_rows():
+            image_id = values[1]  # ID is column index 1
             filename = values[3]  # Filename is column index 3
             selected_items.append((image_id, filename))
         
@@ -1125,10 +1683,12 @@ class ImageUploaderGUI:
                                          "The files will not be deleted from disk.")
         
         if result:
+            # Remove everything first, then write the index once in the background
             success_count = 0
-            for image_id, filename in selected_items:
-                if self.uploader.remove_image(image_id):
-                    success_count += 1
+            with self.uploader.index.bulk_update(save_async=True):
+                for image_id, filename in selected_items:
+                    if self.uploader.remove_image(image_id):
+                        success_count += 1
             
             if success_count == len(selected_items):
                 if len(selected_items) == 1:
@@ -1155,20 +1715,30 @@ class ImageUploaderGUI:
             try:
                 images = self.uploader.list_images()
                 
-                with open(filepath, 'w') as f:
+                separator = "-"*70 + "\n\n"
+                
+                with open(filepath, 'w', buffering=1 << 20) as f:
                     f.write("Image Index Export\n")
                     f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
                     f.write("="*70 + "\n\n")
                     
+                    # One string per image, handed to the file in batches
+                    lines = []
                     for img in images:
-                        f.write(f"ID: {img['id']}\n")
-                        f.write(f"Filename: {img['filename']}\n")
-                        f.write(f"Path: {img['filepath']}\n")
-                        f.write(f"Format: {img['format']}\n")
-                        f.write(f"Dimensions: {img['width']}x{img['height']}\n")
-                        f.write(f"Size: {round(img['size_bytes']/1024, 2)} KB\n")
-                        f.write(f"Added: {img['added_date']}\n")
-                        f.write("-"*70 + "\n\n")
+                        lines.append(
+                            f"ID: {img['id']}\n"
+                            f"Filename: {img['filename']}\n"
+                            f"Path: {img['filepath']}\n"
+                            f"Format: {img['format']}\n"
+                            f"Dimensions: {img['width']}x{img['height']}\n"
+                            f"Size: {round(img['size_bytes']/1024, 2)} KB\n"
+                            f"Added: {img['added_date']}\n"
+                            f"{separator}"
+                        )
+                        if len(lines) >= 256:
+                            f.writelines(lines)
+                            lines.clear()
+                    f.writelines(lines)
                 
                 messagebox.showinfo("Success", f"Index exported to:\n{filepath}")
             except Exception as e:
@@ -1213,8 +1783,7 @@ class ImageUploaderGUI:
         # Clear the index
         try:
             # Clear the JSON file by saving empty list
-            self.uploader.index.images = []
-            self.uploader.index.save_index()
+            self.uploader.index.clear()
             
             # Clear layout profiles
             self.layout_profiles.clear()
@@ -1233,29 +1802,14 @@ class ImageUploaderGUI:
     
     def design_layout(self):
         """Open layout designer for custom slide layouts"""
-        from image_uploader import ImageIdentifier
-        
-        # Get all groups
-        images = self.uploader.list_images()
-        grouped_images = [img for img in images if img.get('metadata', {}).get('numerical_prefix')]
+        # Get unique groups with their images
+        groups_dict = self._get_groups_dict()
+        identifiers_by_group = self._get_group_identifiers()
         
-        if not grouped_images:
+        if not groups_dict:
             messagebox.showwarning("No Groups", "No grouped images found. Please create groups first.")
             return
         
-        # Get unique groups with their identifiers
-        groups_dict = {}
-        for img in grouped_images:
-            metadata = img.get('metadata', {})
-            numerical_prefix = metadata.get('numerical_prefix')
-            identifier = metadata.get('identifier')
-            
-            if numerical_prefix:
-                group_label = ImageIdentifier.format_group_label(numerical_prefix, identifier)
-                if group_label not in groups_dict:
-                    groups_dict[group_label] = []
-                groups_dict[group_label].append(img)
-        
         # Create designer window
         designer_window = tk.Toplevel(self.root)
         designer_window.title("Layout Designer")
@@ -1335,6 +1889,7 @@ class ImageUploaderGUI:
         start_y = None
         region_colors = ['#FFB3BA', '#BAFFC9', '#BAE1FF', '#FFFFBA', '#FFD9BA', '#E0BBE4']
         color_index = [0]
+        region_id_counter = [0]  # Never reused, so IDs stay unique after deletes
         
         def start_draw(event):
             nonlocal start_x, start_y, current_rect
@@ -1362,10 +1917,7 @@ class ImageUploaderGUI:
                 
                 # Get identifier from selected group
                 group = selected_group.get()
-                identifiers = []
-                if group and group in groups_dict:
-                    identifiers = sorted(set(img.get('metadata', {}).get('identifier', 'Unknown') 
-                                           for img in groups_dict[group]))
+                identifiers = identifiers_by_group.get(group, [])
                 
                 # Prompt for identifier
                 if identifiers:
@@ -1396,41 +1948,22 @@ class ImageUploaderGUI:
                 else:
                     identifier = "Image"
                 
-                # Color the region
-                color = region_colors[color_index[0] % len(region_colors)]
-                color_index[0] += 1
-                
-                layout_canvas.itemconfig(current_rect, fill=color, stipple='')
-                
-                # Add label
-                text_id = layout_canvas.create_text((x1 + x2) / 2, (y1 + y2) / 2, 
-                                                   text=identifier, font=('Helvetica', 10, 'bold'))
-                
-                # Store region
-                region_id = len(canvas_regions) + 1
-                canvas_regions.append({
-                    'id': region_id,
-                    'rect_id': current_rect,
-                    'text_id': text_id,
-                    'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2,
-                    'identifier': identifier,
-                    'color': color
-                })
-                
-                update_regions_list()
+                # Replace the rubber-band rectangle with a stored region
+                layout_canvas.delete(current_rect)
                 current_rect = None
+                create_region(x1, y1, x2, y2, identifier)
         
         layout_canvas.bind('<Button-1>', start_draw)
         layout_canvas.bind('<B1-Motion>', draw_rect)
         layout_canvas.bind('<ButtonRelease-1>', end_draw)
         
-        def update_regions_list():
-            regions_listbox.delete(0, tk.END)
-            for region in canvas_regions:
-                width_pct = int((region['x2'] - region['x1']) / canvas_width * 100)
-                height_pct = int((region['y2'] - region['y1']) / canvas_height * 100)
-                regions_listbox.insert(tk.END, 
-                    f"#{region['id']}: {region['identifier']} ({width_pct}% × {height_pct}%)")
+        # Listbox rows for regions added since the last idle flush, so a quick
+        # layout adding several regions updates the list once
+        pending_region_rows = []
+        
+        def flush_region_rows():
+            regions_listbox.insert(tk.END, *pending_region_rows)
+            pending_region_rows.clear()
         
         def delete_selected_region():
             selection = regions_listbox.curselection()
@@ -1440,14 +1973,14 @@ class ImageUploaderGUI:
                 layout_canvas.delete(region['rect_id'])
                 layout_canvas.delete(region['text_id'])
                 canvas_regions.pop(idx)
-                update_regions_list()
+                regions_listbox.delete(idx)
         
         def clear_all_regions():
-            for region in canvas_regions:
-                layout_canvas.delete(region['rect_id'])
-                layout_canvas.delete(region['text_id'])
+            # Every region's rectangle and label carry the 'region' tag
+            layout_canvas.delete('region')
             canvas_regions.clear()
-            update_regions_list()
+            regions_listbox.delete(0, tk.END)
+            pending_region_rows.clear()
         
         def apply_quick_layout(layout_type):
             clear_all_regions()
@@ -1456,8 +1989,7 @@ class ImageUploaderGUI:
             if not group or group not in groups_dict:
                 return
             
-            identifiers = sorted(set(img.get('metadata', {}).get('identifier', 'Unknown') 
-                                   for img in groups_dict[group]))
+            identifiers = identifiers_by_group[group]
             
             if layout_type == 'split_lr' and len(identifiers) >= 2:
                 # Left-right split
@@ -1482,20 +2014,29 @@ class ImageUploaderGUI:
             color_index[0] += 1
             
             rect_id = layout_canvas.create_rectangle(x1, y1, x2, y2, 
-                                                    fill=color, outline='black', width=2)
+                                                    fill=color, outline='black', width=2, tags='region')
             text_id = layout_canvas.create_text((x1 + x2) / 2, (y1 + y2) / 2, 
-                                               text=identifier, font=('Helvetica', 10, 'bold'))
+                                               text=identifier, font=('Helvetica', 10, 'bold'),
+                                               tags='region')
             
-            region_id = len(canvas_regions) + 1
-            canvas_regions.append({
-                'id': region_id,
+            region_id_counter[0] += 1
+            region = {
+                'id': region_id_counter[0],
                 'rect_id': rect_id,
                 'text_id': text_id,
                 'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2,
                 'identifier': identifier,
-                'color': color
-            })
-            update_regions_list()
+                'color': color,
+                # Sizes are fixed once drawn, so compute them and the listbox row only here
+                'width_pct': int((x2 - x1) / canvas_width * 100),
+                'height_pct': int((y2 - y1) / canvas_height * 100)
+            }
+            canvas_regions.append(region)
+            
+            if not pending_region_rows:
+                layout_canvas.after_idle(flush_region_rows)
+            pending_region_rows.append(
+                f"#{region['id']}: {identifier} ({region['width_pct']}% × {region['height_pct']}%)")
         
         ttk.Button(quick_frame, text="Split Left/Right", 
                   command=lambda: apply_quick_layout('split_lr'), width=20).pack(fill=tk.X, pady=2)
@@ -1512,8 +2053,8 @@ class ImageUploaderGUI:
             group = selected_group.get()
             if group and group in groups_dict:
                 imgs = groups_dict[group]
-                identifiers = set(img.get('metadata', {}).get('identifier', 'Unknown') for img in imgs)
-                group_info_label.config(text=f"{len(imgs)} images\nTypes: {', '.join(sorted(identifiers))}")
+                identifiers = identifiers_by_group[group]
+                group_info_label.config(text=f"{len(imgs)} images\nTypes: {', '.join(identifiers)}")
         
         group_combo.bind('<<ComboboxSelected>>', update_group_info)
         
@@ -1531,24 +2072,21 @@ class ImageUploaderGUI:
                 messagebox.showwarning("No Regions", "Please draw at least one region on the canvas.")
                 return
             
-            # Build layout configuration with region data
+            # Build layout configuration with region data, converting pixel
+            # coordinates to fractions of the canvas
             config = {
                 'type': 'visual',
                 'group': group,
                 'canvas_width': canvas_width,
                 'canvas_height': canvas_height,
-                'regions': []
-            }
-            
-            for region in canvas_regions:
-                # Convert pixel coordinates to percentages
-                config['regions'].append({
+                'regions': [{
                     'identifier': region['identifier'],
                     'x1': region['x1'] / canvas_width,
                     'y1': region['y1'] / canvas_height,
                     'x2': region['x2'] / canvas_width,
                     'y2': region['y2'] / canvas_height
-                })
+                } for region in canvas_regions]
+            }
             
             # Save to profiles
             self.layout_profiles[group] = config
@@ -1571,13 +2109,12 @@ class ImageUploaderGUI:
     def generate_powerpoint(self):
         """Generate PowerPoint presentation from grouped images"""
         from ppt_generator import PowerPointGenerator
-        from image_uploader import ImageIdentifier
         
         # Check if there are any grouped images
-        images = self.uploader.list_images()
-        grouped_images = [img for img in images if img.get('metadata', {}).get('numerical_prefix')]
+        groups_dict = self._get_groups_dict()
+        identifiers_by_group = self._get_group_identifiers()
         
-        if not grouped_images:
+        if not groups_dict:
             messagebox.showwarning("No Groups", "No grouped images found. Please upload and group images first.")
             return
         
@@ -1609,19 +2146,7 @@ class ImageUploaderGUI:
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
-        # Get all groups with formatted labels
-        groups_dict = {}
-        for img in grouped_images:
-            metadata = img.get('metadata', {})
-            numerical_prefix = metadata.get('numerical_prefix')
-            identifier = metadata.get('identifier')
-            
-            if numerical_prefix:
-                group_label = ImageIdentifier.format_group_label(numerical_prefix, identifier)
-                if group_label not in groups_dict:
-                    groups_dict[group_label] = []
-                groups_dict[group_label].append(img)
-        
+        # All groups with formatted labels (groups_dict from above)
         sorted_groups = sorted(groups_dict.keys())
         
         # Create checkboxes for each group
@@ -1638,6 +2163,25 @@ class ImageUploaderGUI:
             )
             cb.pack(anchor='w', pady=2)
         
+        # (label, bound var.get) pairs in display order, built once so reading
+        # the selection is just one Tcl call per group
+        group_getters = [(label, var.get) for label, var in group_vars.items()]
+        
+        # Selected labels in display (sorted) order, shared by Preview and
+        # Generate until a checkbox changes; callers must not modify it
+        selected_groups_cache = [None]
+        
+        def invalidate_selection(*args):
+            selected_groups_cache[0] = None
+        
+        for var in group_vars.values():
+            var.trace_add('write', invalidate_selection)
+        
+        def get_selected_groups():
+            if selected_groups_cache[0] is None:
+                selected_groups_cache[0] = [label for label, is_selected in group_getters if is_selected()]
+            return selected_groups_cache[0]
+        
         canvas.pack(side="left", fill="both", expand=True, pady=10)
         scrollbar.pack(side="right", fill="y", pady=10)
         
@@ -1685,7 +2229,7 @@ class ImageUploaderGUI:
         # Preview and Generate buttons
         def preview_slides():
             # Get selected groups
-            selected_groups = [label for label, var in group_vars.items() if var.get()]
+            selected_groups = get_selected_groups()
             
             if not selected_groups:
                 messagebox.showwarning("No Selection", "Please select at least one group.")
@@ -1712,22 +2256,42 @@ class ImageUploaderGUI:
             scrollbar = ttk.Scrollbar(preview_main_frame, orient="vertical", command=canvas.yview)
             scrollable_frame = ttk.Frame(canvas)
             
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-            )
+            # Top and bottom of each slide frame, read from Tk once per layout
+            # rather than on every scroll; emptied whenever the frame re-lays out.
+            # Slides stack downwards, so both lists are sorted for bisect
+            slide_tops = []
+            slide_bottoms = []
+            
+            def on_frame_configure(event):
+                canvas.configure(scrollregion=canvas.bbox("all"))
+                slide_tops.clear()
+                slide_bottoms.clear()
+            
+            scrollable_frame.bind("<Configure>", on_frame_configure)
             
             canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
             
             # Display visual preview for each selected group
-            from ppt_generator import PowerPointGenerator
-            temp_generator = PowerPointGenerator(self.uploader.index)
-            temp_generator.layout_profiles = self.layout_profiles
-            
             # Store preview images to prevent garbage collection
             preview_window.preview_images = {}
             
+            # PhotoImages of slides scrolled away, refilled in place for the
+            # next slide drawn; every slide has the same size, so any one fits
+            photo_pool = []
+            
+            def show_slide_image(slide, image):
+                """Show a slide image in the slide canvas' image item"""
+                if photo_pool:
+                    photo = photo_pool.pop()
+                    photo.paste(image)
+                else:
+                    photo = ImageTk.PhotoImage(image)
+                preview_window.preview_images[slide['idx']] = photo
+                slide['canvas'].itemconfigure(slide['image_item'], image=photo)
+            
+            # Thumbnails decode in parallel; PIL releases the GIL while resampling
+            decode_pool = ThreadPoolExecutor(max_workers=self.SLIDE_PREVIEW_WORKERS)
+            
             def show_slide_details(group_label, images):
                 """Show detailed information about a slide"""
                 detail_text = f"Group: {group_label}\n"
@@ -1737,50 +2301,74 @@ class ImageUploaderGUI:
                     detail_text += f"  • {img['filename']}\n"
                 messagebox.showinfo(f"Slide Details - {group_label}", detail_text)
             
-            for idx, group_label in enumerate(sorted(selected_groups), 1):
-                group_images = groups_dict[group_label]
-                num_images = len(group_images)
+            # Slide canvas size (10:7.5 ratio like PowerPoint)
+            preview_width = 640
+            preview_height = 480
+            
+            # Slides are only drawn while on or near screen; see render_visible
+            slides = []  # [{idx, group_label, group_images, canvas, image_item, frame}]
+            rendered_slides = set()  # Positions in slides currently drawn
+            
+            def render_slide(slide):
+                """
+                Draw one slide's preview onto its canvas.
                 
-                # Determine layout type
-                layout_type = "Grid"
-                if group_label in self.layout_profiles:
-                    profile = self.layout_profiles[group_label]
-                    if profile.get('type') == 'visual':
-                        layout_type = "Visual Custom"
-                    else:
-                        layout_type = profile.get('type', 'auto').title()
-                else:
-                    # Auto-detect layout type
-                    identifiers = [img.get('metadata', {}).get('identifier', '') for img in group_images]
-                    has_spectrum = any(id == 'Spectrum' or id in ImageIdentifier.SPECTRUM_IDENTIFIERS for id in identifiers)
-                    has_other = any(id != 'Spectrum' and id not in ImageIdentifier.SPECTRUM_IDENTIFIERS for id in identifiers)
-                    
-                    if has_spectrum and has_other:
-                        layout_type = "Mixed"
-                    elif has_spectrum:
-                        layout_type = "Horizontal"
-                    else:
-                        rows, cols = temp_generator.calculate_grid_layout(num_images)
-                        layout_type = f"Grid {rows}×{cols}"
+                Thumbnails decode in the background; returns a function that
+                pastes them and finishes the slide, or None if the slide was
+                drawn from the cache.
+                """
+                group_label = slide['group_label']
+                group_images = slide['group_images']
+                slide_canvas = slide['canvas']
                 
-                # Create slide preview frame
-                slide_frame = ttk.LabelFrame(scrollable_frame, 
-                                            text=f"Slide {idx}: {group_label} ({layout_type})", 
-                                            padding="10")
-                slide_frame.pack(fill=tk.X, pady=5, padx=5)
+                # Reuse an earlier render while the slide's images, their files
+                # and its layout profile are unchanged; the cached entry holds
+                # the images and profile, so their ids can't be reused meanwhile
+                profile = self.layout_profiles.get(group_label)
+                mtimes = tuple(_file_mtime(img['filepath']) for img in group_images)
+                cache_key = (group_label, id(group_images), id(profile), mtimes)
+                cached = self._slide_preview_cache.get(cache_key)
+                if cached is not None:
+                    self._slide_preview_cache.move_to_end(cache_key)
+                    for x, y, options in cached[3]:
+                        slide_canvas.create_text(x, y, tags='label', **options)
+                    show_slide_image(slide, cached[2])
+                    return None
                 
-                # Create canvas for visual preview (16:9 aspect ratio matching PowerPoint)
-                preview_width = 640
-                preview_height = 480  # 10:7.5 ratio like PowerPoint
-                slide_canvas = tk.Canvas(slide_frame, width=preview_width, height=preview_height, 
-                                       bg='white', highlightthickness=1, highlightbackground='gray',
-                                       cursor='hand2')
-                slide_canvas.pack(pady=5)
+                # One stat per file serves the cache key, the missing-file check
+                # and the thumbnail cache (None: file missing)
+                file_mtimes = {img['filepath']: mtime for img, mtime in zip(group_images, mtimes)}
                 
-                # Bind click event to show details
-                slide_canvas.bind('<Button-1>', lambda e, gl=group_label, gi=group_images: show_slide_details(gl, gi))
+                # Canvas text drawn over the composite, recorded for the cache
+                texts = []
+                failed = False
+                
+                def add_text(x, y, **options):
+                    texts.append((x, y, options))
+                    slide_canvas.create_text(x, y, tags='label', **options)
+                
+                # Draw slide preview matching PowerPoint formatting. Borders,
+                # placeholders and thumbnails are composed into one image so the
+                # canvas holds a single image item plus the text labels.
+                composite = Image.new('RGB', (preview_width, preview_height), 'white')
+                draw = ImageDraw.Draw(composite)
+                
+                # Thumbnails of this slide being decoded: (future, box, filename label)
+                pending_thumbnails = []
+                
+                def queue_thumbnail(filepath, box, label):
+                    """Start decoding a thumbnail to be centred in box = (x, y, width, height)"""
+                    size = (int(box[2]), int(box[3]))
+                    future = decode_pool.submit(self._load_slide_thumbnail, filepath,
+                                                file_mtimes[filepath], size)
+                    pending_thumbnails.append((future, box, label))
+                
+                def draw_placeholder(img_x, img_y, img_width, img_height, text):
+                    draw.rectangle([img_x, img_y, img_x + img_width, img_y + img_height],
+                                   fill='#E8E8E8', outline='#999')
+                    add_text(img_x + img_width / 2, img_y + img_height / 2,
+                             text=text, font=self._slide_placeholder_font)
                 
-                # Draw slide preview matching PowerPoint formatting
                 try:
                     # PowerPoint dimensions scaled to canvas
                     # Slide: 10" x 7.5", Margins: L/R=0.5", T=0.75", B=0.5"
@@ -1799,13 +2387,55 @@ class ImageUploaderGUI:
                     available_height = preview_height - margin_top - margin_bottom
                     
                     # Draw border
-                    slide_canvas.create_rectangle(0, 0, preview_width, preview_height, 
-                                                 outline='black', width=2)
+                    draw.rectangle([0, 0, preview_width - 1, preview_height - 1], 
+                                   outline='black', width=2)
                     
                     # Draw title (matching PowerPoint title position)
-                    slide_canvas.create_text(margin_left + available_width // 2, title_top + title_height // 2, 
-                                           text=f"Group {group_label}", 
-                                           font=('Arial', 18, 'bold'))
+                    add_text(margin_left + available_width // 2, title_top + title_height // 2, 
+                             text=f"Group {group_label}", 
+                             font=self._slide_title_font)
+                    
+                    def layout_images(images, area_x, area_y, area_width, area_height):
+                        """Lay images out in a grid over the area, queueing their thumbnails"""
+                        rows, cols = PowerPointGenerator.calculate_grid_layout(len(images))
+                        
+                        # Cell positions depend only on the area and grid shape,
+                        # so slides and later previews with the same layout share them
+                        cell_width, available_cell_height, cells = _grid_cells(
+                            area_x, area_y, area_width, area_height, rows, cols,
+                            label_height, label_spacing)
+                        cell_aspect_ratio = cell_width / available_cell_height
+                        padded_cell_width = cell_width * 0.95  # 95% to add small padding
+                        
+                        for img_info, (cell_x, cell_y, label_x, label_y) in zip(images, cells):
+                            img_aspect_ratio = img_info['aspect_ratio']
+                            
+                            # Fit image in cell while maintaining aspect ratio
+                            if cell_aspect_ratio > img_aspect_ratio:
+                                # Height constrained
+                                img_height = available_cell_height
+                                img_width = img_height * img_aspect_ratio
+                            else:
+                                # Width constrained
+                                img_width = padded_cell_width
+                                img_height = img_width / img_aspect_ratio
+                                if img_height > available_cell_height:
+                                    img_height = available_cell_height
+                                    img_width = img_height * img_aspect_ratio
+                            
+                            # Center image in cell (above label area)
+                            img_x = cell_x + (cell_width - img_width) / 2
+                            img_y = cell_y + (available_cell_height - img_height) / 2
+                            
+                            filepath = img_info['filepath']
+                            if file_mtimes[filepath] is None:
+                                draw_placeholder(img_x, img_y, img_width, img_height, "Not Found")
+                                continue
+                            
+                            # Thumbnail plus its filename label below (matching
+                            # PowerPoint), drawn once the thumbnail is decoded
+                            queue_thumbnail(filepath, (img_x, img_y, img_width, img_height),
+                                            (label_x, label_y, img_info['display_name'], cell_width))
                     
                     # Draw image placeholders based on layout
                     if group_label in self.layout_profiles and self.layout_profiles[group_label].get('type') == 'visual':
@@ -1813,15 +2443,12 @@ class ImageUploaderGUI:
                         regions = self.layout_profiles[group_label].get('regions', [])
                         
                         # Group images by their identifier
-                        images_by_identifier = {}
+                        images_by_identifier = defaultdict(list)
                         for img in group_images:
-                            identifier = img.get('metadata', {}).get('identifier', 'Unknown')
-                            if identifier not in images_by_identifier:
-                                images_by_identifier[identifier] = []
-                            images_by_identifier[identifier].append(img)
+                            images_by_identifier[_image_identifier(img)].append(img)
                         
                         # Draw each region with its images
-                        for region_idx, region in enumerate(regions):
+                        for region in regions:
                             # Scale region coordinates to match PowerPoint margins
                             x1 = margin_left + region['x1'] * available_width
                             y1 = margin_top + region['y1'] * available_height
@@ -1832,178 +2459,202 @@ class ImageUploaderGUI:
                             region_images = images_by_identifier.get(region_identifier, [])
                             
                             # Draw region border
-                            slide_canvas.create_rectangle(x1, y1, x2, y2, 
-                                                        outline='#666', width=1)
+                            draw.rectangle([x1, y1, x2, y2], outline='#666', width=1)
                             
                             # If there are images for this identifier, display them
                             if region_images:
-                                # Calculate grid for images in this region
-                                num_region_images = len(region_images)
-                                region_rows, region_cols = temp_generator.calculate_grid_layout(num_region_images)
-                                
-                                region_width = x2 - x1
-                                region_height = y2 - y1
-                                
-                                cell_width = region_width / region_cols
-                                cell_height = region_height / region_rows
-                                
-                                for img_idx, img_info in enumerate(region_images):
-                                    row = img_idx // region_cols
-                                    col = img_idx % region_cols
-                                    
-                                    cell_x = x1 + col * cell_width
-                                    cell_y = y1 + row * cell_height
-                                    
-                                    # Get image aspect ratio
-                                    img_aspect_ratio = img_info['width'] / img_info['height'] if img_info['height'] > 0 else 1.0
-                                    
-                                    # Calculate image dimensions with label space
-                                    available_cell_height = cell_height - label_height - label_spacing
-                                    
-                                    # Fit image maintaining aspect ratio
-                                    if cell_width / available_cell_height > img_aspect_ratio:
-                                        img_height = available_cell_height
-                                        img_width = img_height * img_aspect_ratio
-                                    else:
-                                        img_width = cell_width * 0.95
-                                        img_height = img_width / img_aspect_ratio
-                                        if img_height > available_cell_height:
-                                            img_height = available_cell_height
-                                            img_width = img_height * img_aspect_ratio
-                                    
-                                    # Center image in cell
-                                    img_x = cell_x + (cell_width - img_width) / 2
-                                    img_y = cell_y + (available_cell_height - img_height) / 2
-                                    
-                                    # Load and display image thumbnail
-                                    try:
-                                        filepath = img_info['filepath']
-                                        if os.path.exists(filepath):
-                                            img = Image.open(filepath)
-                                            img.thumbnail((int(img_width), int(img_height)), Image.Resampling.LANCZOS)
-                                            photo = ImageTk.PhotoImage(img)
-                                            preview_window.preview_images[f"{idx}_{region_idx}_{img_idx}"] = photo
-                                            
-                                            slide_canvas.create_image(img_x + img_width / 2, img_y + img_height / 2, image=photo)
-                                            
-                                            # Add filename label
-                                            label_y = cell_y + available_cell_height + label_spacing
-                                            filename = img_info['filename']
-                                            if len(filename) > 20:
-                                                filename = filename[:17] + "..."
-                                            slide_canvas.create_text(cell_x + cell_width / 2, label_y + label_height / 2,
-                                                                   text=filename, font=('Arial', 6), width=cell_width)
-                                        else:
-                                            slide_canvas.create_rectangle(img_x, img_y, img_x + img_width, img_y + img_height,
-                                                                        fill='#E8E8E8', outline='#999')
-                                            slide_canvas.create_text(img_x + img_width / 2, img_y + img_height / 2,
-                                                                   text="Not Found", font=('Arial', 8))
-                                    except Exception as img_err:
-                                        slide_canvas.create_rectangle(img_x, img_y, img_x + img_width, img_y + img_height,
-                                                                    fill='#E8E8E8', outline='#999')
-                                        slide_canvas.create_text(img_x + img_width / 2, img_y + img_height / 2,
-                                                               text="Error", font=('Arial', 8))
+                                layout_images(region_images, x1, y1, x2 - x1, y2 - y1)
                             else:
                                 # No images for this identifier - show label
-                                slide_canvas.create_text((x1+x2)//2, (y1+y2)//2, 
-                                                       text=f"{region_identifier}\n(No images)", 
-                                                       font=('Arial', 10), fill='gray')
-                    else:
+                                add_text((x1+x2)//2, (y1+y2)//2, 
+                                         text=f"{region_identifier}\n(No images)", 
+                                         font=self._slide_message_font, fill='gray')
+                    elif group_images:
                         # Standard grid layout matching PowerPoint
-                        rows, cols = temp_generator.calculate_grid_layout(num_images)
-                        
-                        cell_width = available_width / cols
-                        cell_height = available_height / rows
-                        
-                        for i in range(min(num_images, rows * cols)):
-                            if i >= len(group_images):
-                                break
-                                
-                            row = i // cols
-                            col = i % cols
-                            
-                            # Calculate cell position
-                            cell_x = margin_left + col * cell_width
-                            cell_y = margin_top + row * cell_height
-                            
-                            # Get image info
-                            img_info = group_images[i]
-                            img_aspect_ratio = img_info['width'] / img_info['height'] if img_info['height'] > 0 else 1.0
-                            
-                            # Calculate image dimensions (leaving space for label)
-                            available_cell_height = cell_height - label_height - label_spacing
-                            
-                            # Fit image in cell while maintaining aspect ratio
-                            if cell_width / available_cell_height > img_aspect_ratio:
-                                # Height constrained
-                                img_height = available_cell_height
-                                img_width = img_height * img_aspect_ratio
-                            else:
-                                # Width constrained
-                                img_width = cell_width * 0.95  # 95% to add small padding
-                                img_height = img_width / img_aspect_ratio
-                                if img_height > available_cell_height:
-                                    img_height = available_cell_height
-                                    img_width = img_height * img_aspect_ratio
-                            
-                            # Center image in cell (above label area)
-                            img_x = cell_x + (cell_width - img_width) / 2
-                            img_y = cell_y + (available_cell_height - img_height) / 2
-                            
-                            # Load and display image thumbnail
-                            try:
-                                filepath = img_info['filepath']
-                                if os.path.exists(filepath):
-                                    img = Image.open(filepath)
-                                    img.thumbnail((int(img_width), int(img_height)), Image.Resampling.LANCZOS)
-                                    photo = ImageTk.PhotoImage(img)
-                                    preview_window.preview_images[f"{idx}_{i}"] = photo
-                                    
-                                    slide_canvas.create_image(img_x + img_width / 2, img_y + img_height / 2, image=photo)
-                                    
-                                    # Add filename label below image (matching PowerPoint)
-                                    label_y = cell_y + available_cell_height + label_spacing
-                                    # Truncate filename if too long
-                                    filename = img_info['filename']
-                                    if len(filename) > 20:
-                                        filename = filename[:17] + "..."
-                                    slide_canvas.create_text(cell_x + cell_width / 2, label_y + label_height / 2,
-                                                           text=filename, font=('Arial', 6), width=cell_width)
-                                else:
-                                    slide_canvas.create_rectangle(img_x, img_y, img_x + img_width, img_y + img_height,
-                                                                fill='#E8E8E8', outline='#999')
-                                    slide_canvas.create_text(img_x + img_width / 2, img_y + img_height / 2,
-                                                           text="Not Found", font=('Arial', 8))
-                            except Exception as img_err:
-                                # Draw placeholder rectangle
-                                slide_canvas.create_rectangle(img_x, img_y, img_x + img_width, img_y + img_height,
-                                                            fill='#E8E8E8', outline='#999')
-                                slide_canvas.create_text(img_x + img_width / 2, img_y + img_height / 2,
-                                                       text="Error", font=('Arial', 8))
+                        layout_images(group_images, margin_left, margin_top,
+                                      available_width, available_height)
                 
                 except Exception as e:
-                    slide_canvas.create_text(preview_width//2, preview_height//2, 
-                                           text=f"Preview error: {str(e)}", 
-                                           font=('Arial', 10))
+                    failed = True
+                    add_text(preview_width//2, preview_height//2, 
+                             text=f"Preview error: {str(e)}", 
+                             font=self._slide_message_font)
                 
-                # Info label below canvas
-                info = f"{num_images} image{'s' if num_images != 1 else ''} | "
-                info += f"Files: {', '.join([img['filename'] for img in group_images[:2]])}"
-                if num_images > 2:
-                    info += f" ... +{num_images - 2} more"
+                def finish():
+                    """Paste the decoded thumbnails and put the slide image on the canvas"""
+                    nonlocal failed
+                    
+                    # Paste the decoded thumbnails centred in their boxes
+                    for future, box, label in pending_thumbnails:
+                        img_x, img_y, img_width, img_height = box
+                        try:
+                            img = future.result()
+                        except Exception:
+                            # Missing files were already drawn as "Not Found";
+                            # only unreadable or corrupt images get here, and
+                            # decoders fail on those with all sorts of errors
+                            # (SyntaxError, struct.error, MemoryError, ...)
+                            draw_placeholder(img_x, img_y, img_width, img_height, "Error")
+                            failed = True
+                            continue
+                        position = (int(img_x + (img_width - img.width) / 2),
+                                    int(img_y + (img_height - img.height) / 2))
+                        composite.paste(img, position, img if img.mode == 'RGBA' else None)
+                        label_x, label_y, filename, label_width = label
+                        add_text(label_x, label_y, text=filename,
+                                 font=self._slide_label_font, width=label_width)
+                    
+                    show_slide_image(slide, composite)
+                    
+                    # Don't keep renders with errors; the next preview retries them
+                    if not failed:
+                        self._slide_preview_cache[cache_key] = (group_images, profile, composite, texts)
+                        if len(self._slide_preview_cache) > self.SLIDE_PREVIEW_CACHE_SIZE:
+                            self._slide_preview_cache.popitem(last=False)
+                
+                return finish
+            
+            def add_slide(idx, group_label):
+                """Build the frame, canvas and info label for one slide"""
+                group_images = groups_dict[group_label]
+                num_images = len(group_images)
+                
+                # Determine layout type
+                layout_type = "Grid"
+                if group_label in self.layout_profiles:
+                    profile = self.layout_profiles[group_label]
+                    if profile.get('type') == 'visual':
+                        layout_type = "Visual Custom"
+                    else:
+                        layout_type = profile.get('type', 'auto').title()
+                else:
+                    # Auto-detect layout type
+                    identifiers = identifiers_by_group[group_label]
+                    has_spectrum = not _SPECTRUM_LABELS.isdisjoint(identifiers)
+                    has_other = not _SPECTRUM_LABELS.issuperset(identifiers)
+                    
+                    if has_spectrum and has_other:
+                        layout_type = "Mixed"
+                    elif has_spectrum:
+                        layout_type = "Horizontal"
+                    else:
+                        rows, cols = PowerPointGenerator.calculate_grid_layout(num_images)
+                        layout_type = f"Grid {rows}×{cols}"
                 
+                # Create slide preview frame
+                slide_frame = ttk.LabelFrame(scrollable_frame, 
+                                            text=f"Slide {idx}: {group_label} ({layout_type})", 
+                                            padding="10")
+                slide_frame.pack(fill=tk.X, pady=5, padx=5)
+                
+                # Create canvas for visual preview
+                slide_canvas = tk.Canvas(slide_frame, width=preview_width, height=preview_height, 
+                                       bg='white', highlightthickness=1, highlightbackground='gray',
+                                       cursor='hand2')
+                slide_canvas.pack(pady=5)
+                
+                # The canvas keeps one image item, created first so it stays below
+                # the text labels; renders swap its image instead of recreating it
+                image_item = slide_canvas.create_image(0, 0, anchor='nw')
+                
+                # Bind click event to show details
+                slide_canvas.bind('<Button-1>', lambda e, gl=group_label, gi=group_images: show_slide_details(gl, gi))
+                
+                slides.append({'idx': idx, 'group_label': group_label, 'group_images': group_images,
+                               'canvas': slide_canvas, 'image_item': image_item, 'frame': slide_frame})
+                
+                # Info label below canvas
+                # Built once per group until the index changes
+                info = self._get_group_summary(group_label)
                 ttk.Label(slide_frame, text=info, foreground='gray').pack(anchor='w', pady=(5, 0))
             
+            def add_slide_batch(start):
+                """Build one batch of slide frames and schedule the next one"""
+                if not preview_window.winfo_exists():
+                    return  # Closed while slides were still being added
+                end = min(start + self.SLIDE_FRAME_BATCH_SIZE, len(selected_groups))
+                for idx in range(start, end):
+                    add_slide(idx + 1, selected_groups[idx])
+                if end < len(selected_groups):
+                    # A timer rather than an idle callback, so the
+                    # update_idletasks in render_visible can't run every
+                    # remaining batch at once
+                    preview_window.after(1, add_slide_batch, end)
+            
+            render_pending = [None]
+            
+            def render_visible():
+                """Render slides near the viewport and drop those scrolled far away"""
+                render_pending[0] = None
+                view_height = canvas.winfo_height()
+                if view_height <= 1:
+                    return  # Not laid out yet; the first scroll update retries
+                if not slide_tops:
+                    scrollable_frame.update_idletasks()  # Settle pending geometry first
+                    for slide in slides:
+                        frame = slide['frame']
+                        frame_top = frame.winfo_y()
+                        slide_tops.append(frame_top)
+                        slide_bottoms.append(frame_top + frame.winfo_height())
+                top = canvas.canvasy(0)
+                bottom = top + view_height
+                
+                # Drop slides scrolled well out of view; only drawn slides are visited
+                for pos in [pos for pos in rendered_slides
+                            if slide_bottoms[pos] < top - 3 * view_height or
+                            slide_tops[pos] > bottom + 3 * view_height]:
+                    slide = slides[pos]
+                    slide['canvas'].delete('label')
+                    slide['canvas'].itemconfigure(slide['image_item'], image='')
+                    photo = preview_window.preview_images.pop(slide['idx'], None)
+                    if photo is not None:
+                        photo_pool.append(photo)
+                    rendered_slides.discard(pos)
+                
+                # Slides within a viewport of the screen, found by bisection.
+                # Start every newly visible slide before finishing any, so all
+                # their thumbnails decode on the pool together
+                first = bisect_left(slide_bottoms, top - view_height)
+                last = bisect_right(slide_tops, bottom + view_height)
+                finishers = []
+                for pos in range(first, last):
+                    if pos not in rendered_slides:
+                        finish = render_slide(slides[pos])
+                        if finish is not None:
+                            finishers.append(finish)
+                        rendered_slides.add(pos)
+                for finish in finishers:
+                    finish()
+            
+            def on_scroll(first, last):
+                scrollbar.set(first, last)
+                if render_pending[0] is None:
+                    render_pending[0] = canvas.after_idle(render_visible)
+            
+            # Called whenever the view moves or the window/scroll region resizes
+            canvas.configure(yscrollcommand=on_scroll)
+            
+            def on_preview_destroy(event):
+                if event.widget is preview_window:
+                    decode_pool.shutdown(wait=False)
+            
+            preview_window.bind('<Destroy>', on_preview_destroy, add='+')
+            
             canvas.pack(side="left", fill="both", expand=True)
             scrollbar.pack(side="right", fill="y")
             
             # Close button
             ttk.Button(preview_main_frame, text="Close", 
                       command=preview_window.destroy, width=15).pack(pady=10)
+            
+            # Slides appear batch by batch so the window opens and responds at
+            # once even with many groups; each frame's <Configure> re-reads the
+            # slide bounds and the scroll update draws those that come into view
+            add_slide_batch(0)
         
         def generate():
             # Get selected groups
-            selected_groups = [label for label, var in group_vars.items() if var.get()]
+            selected_groups = get_selected_groups()
             
             if not selected_groups:
                 messagebox.showwarning("No Selection", "Please select at least one group.")
@@ -2014,23 +2665,64 @@ class ImageUploaderGUI:
                 messagebox.showwarning("No Output File", "Please specify an output file.")
                 return
             
-            # Validate output directory exists
+            # Validate output directory exists (one stat; a bare filename
+            # goes to the working directory and needs no check)
             output_dir = os.path.dirname(output_path)
-            if output_dir and not os.path.exists(output_dir):
+            if output_dir and not os.path.isdir(output_dir):
                 messagebox.showerror("Invalid Path", f"Directory does not exist:\n{output_dir}")
                 return
             
             # Close selection window
             selection_window.destroy()
             
-            # Generate presentation
-            try:
-                generator = PowerPointGenerator(self.uploader.index)
-                # Pass layout profiles to generator
-                generator.layout_profiles = self.layout_profiles
-                success = generator.generate_presentation(output_path, selected_groups)
+            # Build the presentation on a worker thread so Tk keeps drawing
+            # while images are read and the file is written; the outcome
+            # comes back through the queue as ('ok', None) or ('err', message)
+            progress_window = tk.Toplevel(self.root)
+            progress_window.title("Generating PowerPoint")
+            progress_window.geometry("400x120")
+            progress_window.transient(self.root)
+            
+            ttk.Label(progress_window, text="Generating PowerPoint...", 
+                     font=('Helvetica', 12)).pack(pady=10)
+            
+            progress_bar = ttk.Progressbar(progress_window, length=350, mode='indeterminate')
+            progress_bar.pack(pady=10)
+            progress_bar.start()
+            
+            # Keep the index and layouts unchanged until the build finishes
+            progress_window.protocol("WM_DELETE_WINDOW", lambda: None)
+            progress_window.grab_set()
+            
+            results = queue.Queue()
+            
+            def do_generate():
+                try:
+                    generator = PowerPointGenerator(self.uploader.index)
+                    # Pass layout profiles to generator
+                    generator.layout_profiles = self.layout_profiles
+                    # Reuse the grouping the dialog was built from rather than regrouping the index
+                    if generator.generate_presentation(output_path, selected_groups, groups=groups_dict):
+                        results.put(('ok', None))
+                    else:
+                        results.put(('err', "Failed to generate PowerPoint. Check console for details."))
+                except Exception as e:
+                    results.put(('err', f"Failed to generate PowerPoint:\n{str(e)}"))
+            
+            threading.Thread(target=do_generate, daemon=True).start()
+            
+            def poll_generate():
+                try:
+                    status, message = results.get_nowait()
+                except queue.Empty:
+                    self.root.after(self.GENERATE_POLL_MS, poll_generate)
+                    return
                 
-                if success:
+                progress_bar.stop()
+                progress_window.grab_release()
+                progress_window.destroy()
+                
+                if status == 'ok':
                     result = messagebox.askquestion("Success", 
                                       f"PowerPoint generated successfully!\n\n"
                                       f"File: {output_path}\n"
@@ -2038,16 +2730,17 @@ class ImageUploaderGUI:
                                       f"Would you like to open the file location?")
                     
                     if result == 'yes':
-                        # Open file location in Finder/Explorer
+                        # Open file location in Finder/Explorer without
+                        # waiting for the file manager to return
                         import subprocess
                         if os.name == 'posix':  # macOS/Linux
-                            subprocess.run(['open', '-R', output_path])
+                            subprocess.Popen(['open', '-R', output_path], start_new_session=True)
                         elif os.name == 'nt':  # Windows
-                            subprocess.run(['explorer', '/select,', output_path])
+                            subprocess.Popen(['explorer', '/select,', output_path])
                 else:
-                    messagebox.showerror("Error", "Failed to generate PowerPoint. Check console for details.")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to generate PowerPoint:\n{str(e)}")
+                    messagebox.showerror("Error", message)
+            
+            self.root.after(self.GENERATE_POLL_MS, poll_generate)
         
         action_frame = ttk.Frame(main_frame)
         action_frame.pack(pady=10)
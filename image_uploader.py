@@ -8,10 +8,70 @@ import os
 import json
 import re
 from datetime import datetime
-from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
 from PIL import Image
 import hashlib
+import shutil
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_index(images: List[Dict]) -> bytes:
+    """Serialize index records to compact UTF-8 JSON, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(images)
+    return json.dumps(images, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _loads_index(data: bytes) -> List[Dict]:
+    """Parse index JSON, using orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# What may follow an identifier in a filename: a separator, parenthesis or
+# digit, a lowercase suffix like "mod2", or the end of the name
+_IDENTIFIER_END = r'(?:[\s_\-\(\d]|[a-z]+\d*|$)'
+
+
+def _trie_pattern(words: List[str]) -> Tuple[str, Tuple[int, ...]]:
+    """
+    Build a regex matching any of the words, factored by common prefix.
+    
+    Each word ends in an empty capturing group, so match.lastindex tells
+    which word matched: returns the pattern and, for group n, the index in
+    words of its word at position n - 1. Longer words are tried before their
+    prefixes (PDBSE1 before PDBSE). Matching is meant to be case-insensitive;
+    the trie is built lowercase.
+    """
+    trie = {}
+    for index, word in enumerate(words):
+        node = trie
+        for char in word.lower():
+            node = node.setdefault(char, {})
+        node[''] = index
+    
+    word_indices = []
+    
+    def build(node):
+        # Siblings start with different characters, so only one can match;
+        # only a word ending here has to wait for the longer continuations
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if '' in node:
+            word_indices.append(node[''])
+            branches.append('()')
+        return branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    
+    return build(trie), tuple(word_indices)
 
 
 class ImageIdentifier:
@@ -27,10 +87,74 @@ class ImageIdentifier:
     TRAILING_NUMBER_IDENTIFIERS = ['Map', 'Maps', 'Electron Image', 'Spectrum', 'Spectra']
     
     # Spectrum identifiers (for special horizontal layout)
-    SPECTRUM_IDENTIFIERS = ['Spectrum', 'Spectra']
+    SPECTRUM_IDENTIFIERS = frozenset({'Spectrum', 'Spectra'})
+    
+    # Map identifiers (grouped and labelled as MAP1, MAP2, etc.)
+    MAP_IDENTIFIERS = frozenset({'Map', 'Maps', 'Electron Image'})
     
     ALL_IDENTIFIERS = GROUPABLE_IDENTIFIERS + NON_GROUPABLE_IDENTIFIERS
     
+    # Same identifiers as a set, for membership tests
+    ALL_IDENTIFIERS_SET = frozenset(ALL_IDENTIFIERS)
+    
+    # Identifiers tried longest first so more specific ones match first
+    # (PDBSE1 before PDBSE); the sort is stable, so ties keep list order
+    _SORTED_IDENTIFIERS = tuple(sorted(ALL_IDENTIFIERS, key=len, reverse=True))
+    
+    # Every identifier occurrence in one pass over the filename. The
+    # identifiers form a character trie, so each position walks one branch
+    # instead of trying all 15; the boundaries are lookarounds, so adjacent
+    # identifiers sharing a separator are all found
+    # _IDENT_RANKS[match.lastindex - 1] is the matched identifier's index
+    # in _SORTED_IDENTIFIERS
+    _IDENT_TRIE, _IDENT_RANKS = _trie_pattern(_SORTED_IDENTIFIERS)
+    _IDENT_PATTERN = re.compile(r'(?:^|(?<=[\s_\-]))' + _IDENT_TRIE + r'(?=[\s_\-\(\da-z]|$)',
+                                re.IGNORECASE)
+    
+    # Patterns for the number that goes with an identifier, compiled once
+    # per identifier rather than on every call
+    # 4-digit prefix, e.g. "prefix_0001_1_PDBSE" or "0001_PDBSE"
+    _GROUPABLE_NUM_PATTERNS = {
+        identifier: re.compile(r'(\d{4})[\s\-_]+\d*[\s\-_]*' + re.escape(identifier) + _IDENTIFIER_END, re.IGNORECASE)
+        for identifier in GROUPABLE_IDENTIFIERS
+    }
+    # Any number right before the identifier, e.g. "12 UD"
+    _GROUPABLE_NUM_PATTERNS2 = {
+        identifier: re.compile(r'(\d+)[\s\-_]+' + re.escape(identifier) + _IDENTIFIER_END, re.IGNORECASE)
+        for identifier in GROUPABLE_IDENTIFIERS
+    }
+    # Number after the identifier, e.g. "ABF 0100"
+    _GROUPABLE_NUM_AFTER_PATTERNS = {
+        identifier: re.compile(re.escape(identifier) + r'[\s\-_]+(\d+)', re.IGNORECASE)
+        for identifier in GROUPABLE_IDENTIFIERS
+    }
+    # Number after a map identifier and optional words, e.g. "Map Data 1_1"
+    _MAP_AFTER_PATTERNS = {
+        identifier: re.compile(re.escape(identifier) + r'(?:\s+\w+)*?[_\s\-]+(\d+)(?:_\d+)?(?:\s|$)', re.IGNORECASE)
+        for identifier in MAP_IDENTIFIERS
+    }
+    # Every (possibly overlapping) start of a map identifier, for _search_map_number
+    _MAP_START_PATTERNS = {
+        identifier: re.compile(r'(?=' + re.escape(identifier) + r')', re.IGNORECASE)
+        for identifier in MAP_IDENTIFIERS
+    }
+    # The run of whitespace-separated words _MAP_AFTER_PATTERNS may skip over
+    _WORD_CHAIN_PATTERN = re.compile(r'(?:\s+\w+)*')
+    # Every number pattern below needs a digit somewhere in the name
+    _DIGIT_PATTERN = re.compile(r'\d')
+    # Last number before any trailing "_1"-style suffix, e.g. "xyz 3_1"
+    _MAP_FALLBACK_PATTERN = re.compile(r'[_\s\-](\d+)(?:_\d+)?\s*$')
+    # Trailing number of a spectrum file, e.g. "Spectrum 5"
+    _SPECTRUM_TRAIL_PATTERN = re.compile(r'[_\s\-]?(\d+)(?:_\d+)?\s*$')
+    
+    # Sort category and within-category priority of each identifier, for
+    # get_sort_key (unknown identifiers: category 3, priority 999)
+    _SORT_CATEGORY = dict.fromkeys(GROUPABLE_IDENTIFIERS, 0)
+    _SORT_CATEGORY.update(dict.fromkeys(MAP_IDENTIFIERS, 1))
+    _SORT_CATEGORY.update(dict.fromkeys(SPECTRUM_IDENTIFIERS, 2))
+    _SORT_PRIORITY = dict(zip(GROUPABLE_IDENTIFIERS, range(len(GROUPABLE_IDENTIFIERS))))
+    _SORT_PRIORITY.update(zip(NON_GROUPABLE_IDENTIFIERS, range(100, 100 + len(NON_GROUPABLE_IDENTIFIERS))))
+    
     @staticmethod
     def format_group_label(numerical_prefix: Optional[str], identifier: Optional[str]) -> str:
         """
@@ -48,14 +172,14 @@ class ImageIdentifier:
         
         # Check if it's a 4-digit numeric code (auto-formatted groups)
         if numerical_prefix.isdigit() and len(numerical_prefix) == 4:
-            if identifier in ['Spectrum', 'Spectra']:
+            if identifier in ImageIdentifier.SPECTRUM_IDENTIFIERS:
                 # Spectrum groups: format as SPEC1, SPEC2, etc.
                 try:
                     spec_num = int(numerical_prefix)
                     return f"SPEC{spec_num}"
                 except (ValueError, TypeError):
                     return numerical_prefix
-            elif identifier in ['Map', 'Maps', 'Electron Image']:
+            elif identifier in ImageIdentifier.MAP_IDENTIFIERS:
                 # Map/Electron Image groups: format as MAP1, MAP2, etc.
                 try:
                     map_num = int(numerical_prefix)
@@ -70,10 +194,39 @@ class ImageIdentifier:
             return numerical_prefix
     
     @staticmethod
+    def _search_map_number(identifier: str, name: str) -> Optional[re.Match]:
+        """
+        Same result as _MAP_AFTER_PATTERNS[identifier].search(name), in linear time.
+        
+        A plain search retries from every occurrence of the identifier, and
+        each try can walk all the words after it, so "Map Map Map ..." takes
+        quadratic time. A failed try has already walked the words after its
+        occurrence, including every later occurrence among them and whatever
+        could follow it, so those occurrences are skipped.
+        """
+        after_pattern = ImageIdentifier._MAP_AFTER_PATTERNS[identifier]
+        skip_from = skip_until = 0
+        for start in ImageIdentifier._MAP_START_PATTERNS[identifier].finditer(name):
+            position = start.start()
+            if skip_from <= position < skip_until:
+                continue
+            after_match = after_pattern.match(name, position)
+            if after_match:
+                return after_match
+            # Occurrences overlapping this one (before skip_from) are still tried
+            skip_from = position + len(identifier)
+            skip_until = ImageIdentifier._WORD_CHAIN_PATTERN.match(name, skip_from).end()
+        return None
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
     def extract_identifier_and_number(filename: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """
         Extract identifier and numerical prefix from filename.
         
+        Results are cached by filename: bulk adds and reindexing see the
+        same names (e.g. "Map Data 1.tif" in every sample folder) many times.
+        
         Returns:
             Tuple of (numerical_prefix, identifier, full_match)
             Example: "0001 PDBSE image.tif" -> ("0001", "PDBSE", "0001 PDBSE")
@@ -82,93 +235,90 @@ class ImageIdentifier:
         # Remove file extension
         name_without_ext = os.path.splitext(filename)[0]
         
-        # Try to find any identifier in the filename
-        # Sort identifiers by length (longest first) to match more specific ones first
-        sorted_identifiers = sorted(ImageIdentifier.ALL_IDENTIFIERS, key=len, reverse=True)
+        # Find identifiers with flexible word boundaries (space, underscore,
+        # dash or string boundaries, then a separator, parenthesis, digit or
+        # letter suffix), case-insensitively; the most specific one wins
+        best = None
+        best_rank = None
+        for match in ImageIdentifier._IDENT_PATTERN.finditer(name_without_ext):
+            rank = ImageIdentifier._IDENT_RANKS[match.lastindex - 1]
+            if best is None or rank < best_rank:
+                best, best_rank = match, rank
+                if rank == 0:
+                    break  # Nothing is more specific
+        
+        if best is None:
+            # No identifier found
+            return (None, None, None)
         
-        for identifier in sorted_identifiers:
-            # Case-insensitive search with flexible word boundaries (space, underscore, dash, or string boundaries)
-            # Also allow for characters like parentheses or alphanumeric suffixes after the identifier
-            pattern = re.compile(r'(?:^|[\s_\-])(' + re.escape(identifier) + r')(?:[\s_\-\(\d]|[a-z]+\d*|$)', re.IGNORECASE)
-            match = pattern.search(name_without_ext)
+        identifier = ImageIdentifier._SORTED_IDENTIFIERS[best_rank]
+        found_identifier = best.group(0)
+        
+        if not ImageIdentifier._DIGIT_PATTERN.search(name_without_ext):
+            # No number to group by, e.g. "PDBSE image"
+            return (None, identifier, found_identifier)
+                
+        # Check if this is a groupable identifier
+        if identifier in ImageIdentifier.GROUPABLE_IDENTIFIERS:
+            # Look for numerical prefix before the identifier
+            # Pattern: digits followed by optional separators (space, dash, underscore)
+            # Also look for patterns like: prefix_0001_1_PDBSE or 0001_PDBSE
+            num_match = ImageIdentifier._GROUPABLE_NUM_PATTERNS[identifier].search(name_without_ext)
+            
+            if num_match:
+                numerical_prefix = num_match.group(1)  # Already 4 digits
+                full_match = num_match.group(0).strip()
+                return (numerical_prefix, identifier, full_match)
+            
+            # Simpler pattern for adjacent numbers
+            num_match2 = ImageIdentifier._GROUPABLE_NUM_PATTERNS2[identifier].search(name_without_ext)
+            
+            if num_match2:
+                numerical_prefix = num_match2.group(1).zfill(4)  # Pad with zeros to 4 digits
+                full_match = num_match2.group(0).strip()
+                return (numerical_prefix, identifier, full_match)
+            
+            # Also try to find number after the identifier (e.g., "ABF 0100")
+            num_match_after = ImageIdentifier._GROUPABLE_NUM_AFTER_PATTERNS[identifier].search(name_without_ext)
+            
+            if num_match_after:
+                numerical_prefix = num_match_after.group(1).zfill(4)
+                full_match = num_match_after.group(0)
+                return (numerical_prefix, identifier, full_match)
             
-            if match:
-                # Found an identifier
-                found_identifier = match.group(1)
+            # Identifier found but no number - still valid
+            return (None, identifier, found_identifier)
+        else:
+            # Non-groupable identifier (Spectrum, Map, etc.)
+            # Keep original identifier - don't normalize
+            # For Map/Maps/Electron Image, look for a number after the identifier or at the end
+            if identifier in ImageIdentifier.MAP_IDENTIFIERS:
+                # First, try to find number right after the identifier: "Map Data 1_1" or "Electron Image 3_1"
+                # Pattern: identifier followed by optional words, then space/separator and number (before any underscore suffix)
+                after_match = ImageIdentifier._search_map_number(identifier, name_without_ext)
                 
-                # Check if this is a groupable identifier
-                if identifier in ImageIdentifier.GROUPABLE_IDENTIFIERS:
-                    # Look for numerical prefix before the identifier
-                    # Pattern: digits followed by optional separators (space, dash, underscore)
-                    # Also look for patterns like: prefix_0001_1_PDBSE or 0001_PDBSE
-                    num_pattern = re.compile(r'(\d{4})[\s\-_]+\d*[\s\-_]*' + re.escape(identifier) + r'(?:[\s_\-\(\d]|[a-z]+\d*|$)', re.IGNORECASE)
-                    num_match = num_pattern.search(name_without_ext)
-                    
-                    if num_match:
-                        numerical_prefix = num_match.group(1)  # Already 4 digits
-                        full_match = num_match.group(0).strip()
-                        return (numerical_prefix, identifier, full_match)
-                    
-                    # Simpler pattern for adjacent numbers
-                    num_pattern2 = re.compile(r'(\d+)[\s\-_]+' + re.escape(identifier) + r'(?:[\s_\-\(\d]|[a-z]+\d*|$)', re.IGNORECASE)
-                    num_match2 = num_pattern2.search(name_without_ext)
-                    
-                    if num_match2:
-                        numerical_prefix = num_match2.group(1).zfill(4)  # Pad with zeros to 4 digits
-                        full_match = num_match2.group(0).strip()
-                        return (numerical_prefix, identifier, full_match)
-                    
-                    # Also try to find number after the identifier (e.g., "ABF 0100")
-                    num_pattern_after = re.compile(re.escape(identifier) + r'[\s\-_]+(\d+)', re.IGNORECASE)
-                    num_match_after = num_pattern_after.search(name_without_ext)
-                    
-                    if num_match_after:
-                        numerical_prefix = num_match_after.group(1).zfill(4)
-                        full_match = num_match_after.group(0)
-                        return (numerical_prefix, identifier, full_match)
-                    
-                    # Identifier found but no number - still valid
-                    return (None, identifier, found_identifier)
-                else:
-                    # Non-groupable identifier (Spectrum, Map, etc.)
-                    # Keep original identifier - don't normalize
-                    # For Map/Maps/Electron Image, look for a number after the identifier or at the end
-                    if identifier in ['Map', 'Maps', 'Electron Image']:
-                        # First, try to find number right after the identifier: "Map Data 1_1" or "Electron Image 3_1"
-                        # Pattern: identifier followed by optional words, then space/separator and number (before any underscore suffix)
-                        after_id_pattern = re.compile(
-                            re.escape(identifier) + r'(?:\s+\w+)*?[_\s\-]+(\d+)(?:_\d+)?(?:\s|$)',
-                            re.IGNORECASE
-                        )
-                        after_match = after_id_pattern.search(name_without_ext)
-                        
-                        if after_match:
-                            numerical_prefix = after_match.group(1).zfill(4)
-                            return (numerical_prefix, identifier, found_identifier)
-                        
-                        # Fallback: look for the last number before any trailing underscore suffix (like "_1")
-                        # This catches patterns like "xyz 3_1" where 3 is the group number
-                        fallback_pattern = re.compile(r'[_\s\-](\d+)(?:_\d+)?\s*$')
-                        fallback_match = fallback_pattern.search(name_without_ext)
-                        
-                        if fallback_match:
-                            numerical_prefix = fallback_match.group(1).zfill(4)
-                            return (numerical_prefix, identifier, found_identifier)
-                    
-                    elif identifier in ['Spectrum', 'Spectra']:
-                        # Spectrum files - look for trailing number
-                        trailing_num_pattern = re.compile(r'[_\s\-]?(\d+)(?:_\d+)?\s*$')
-                        trailing_match = trailing_num_pattern.search(name_without_ext)
-                        
-                        if trailing_match:
-                            numerical_prefix = trailing_match.group(1).zfill(4)
-                            return (numerical_prefix, identifier, found_identifier)
-                    
-                    # No grouping if no trailing number found
-                    return (None, identifier, found_identifier)
-        
-        # No identifier found
-        return (None, None, None)
+                if after_match:
+                    numerical_prefix = after_match.group(1).zfill(4)
+                    return (numerical_prefix, identifier, found_identifier)
+                
+                # Fallback: look for the last number before any trailing underscore suffix (like "_1")
+                # This catches patterns like "xyz 3_1" where 3 is the group number
+                fallback_match = ImageIdentifier._MAP_FALLBACK_PATTERN.search(name_without_ext)
+                
+                if fallback_match:
+                    numerical_prefix = fallback_match.group(1).zfill(4)
+                    return (numerical_prefix, identifier, found_identifier)
+            
+            elif identifier in ImageIdentifier.SPECTRUM_IDENTIFIERS:
+                # Spectrum files - look for trailing number
+                trailing_match = ImageIdentifier._SPECTRUM_TRAIL_PATTERN.search(name_without_ext)
+                
+                if trailing_match:
+                    numerical_prefix = trailing_match.group(1).zfill(4)
+                    return (numerical_prefix, identifier, found_identifier)
+            
+            # No grouping if no trailing number found
+            return (None, identifier, found_identifier)
     
     @staticmethod
     def get_sort_key(img_info: Dict) -> Tuple:
@@ -191,21 +341,10 @@ class ImageIdentifier:
         # Category 1: Map-like types (Map, Maps, Electron Image)
         # Category 2: Spectrum types (Spectrum, Spectra)
         # Category 3: Ungrouped items (unknown files)
-        if identifier in ImageIdentifier.GROUPABLE_IDENTIFIERS:
-            category = 0
-        elif identifier in ['Map', 'Maps', 'Electron Image']:
-            category = 1  # Map-like groups are separate
-        elif identifier in ['Spectrum', 'Spectra']:
-            category = 2  # Spectrum groups are separate
-        else:
-            category = 3  # Ungrouped
-        
-        # Define priority order for identifiers within their category
-        identifier_priority = {id_name: idx for idx, id_name in enumerate(ImageIdentifier.GROUPABLE_IDENTIFIERS)}
-        identifier_priority.update({id_name: 100 + idx for idx, id_name in enumerate(ImageIdentifier.NON_GROUPABLE_IDENTIFIERS)})
+        category = ImageIdentifier._SORT_CATEGORY.get(identifier, 3)
         
-        # Get priority (default to 999 if not found)
-        priority = identifier_priority.get(identifier, 999)
+        # Priority order for identifiers within their category (default to 999 if not found)
+        priority = ImageIdentifier._SORT_PRIORITY.get(identifier, 999)
         
         # If no numerical prefix, put it at the end within its category
         if not numerical_prefix:
@@ -217,31 +356,189 @@ class ImageIdentifier:
 class ImageIndex:
     """Manages the indexing of uploaded images"""
     
+    # Read size for hashing image files; large reads keep Python-level
+    # overhead per byte low on multi-megabyte TIFFs
+    HASH_CHUNK_SIZE = 1 << 20
+    
     def __init__(self, index_file: str = "image_index.json"):
         self.index_file = index_file
         self.images: List[Dict] = []
+        # Guards self.images and the index file; uploads may run on worker threads
+        self._lock = threading.RLock()
+        self._by_id: Dict[int, Dict] = {}
+        self._by_hash: Dict[str, Dict] = {}  # File hash -> image, for duplicate checks
+        self._next_id = 1
+        # Running totals for get_stats(), kept in step with self.images
+        self._total_bytes = 0
+        self._format_counts: Counter = Counter()
+        self._bulk_depth = 0  # Nesting level of bulk_update() blocks
+        # Saves serialize under _lock and write under _write_lock; each
+        # snapshot gets a sequence number so an older one never overwrites
+        # a newer one on disk
+        self._write_lock = threading.Lock()
+        self._save_seq = 0
+        self._written_seq = 0
+        # Background saves: the latest unwritten snapshot, and whether a
+        # write job is already queued to pick it up
+        self._save_executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_lock = threading.Lock()
+        self._pending_save: Optional[Tuple[int, bytes]] = None
+        self._save_scheduled = False
         self.load_index()
     
     def load_index(self):
         """Load existing index from file"""
-        if os.path.exists(self.index_file):
-            try:
-                with open(self.index_file, 'r') as f:
-                    self.images = json.load(f)
-            except json.JSONDecodeError:
-                self.images = []
+        try:
+            with open(self.index_file, 'rb') as f:
+                self.images = _loads_index(f.read())
+        except FileNotFoundError:
+            pass
+        except ValueError:
+            # Corrupt index: malformed JSON or not UTF-8
+            self.images = []
+        self._rebuild_lookups()
+    
+    def _rebuild_lookups(self):
+        """Rebuild the ID and hash lookup tables, next ID and stats totals from self.images"""
+        by_id = {}
+        by_hash = {}
+        for img in self.images:
+            # Older indexes may repeat an ID or hash; keep the first, as a scan
+            # would. Hand-edited records may lack either and are never matched
+            if img.get('id') is not None:
+                by_id.setdefault(img['id'], img)
+            if img.get('hash') is not None:
+                by_hash.setdefault(img['hash'], img)
+            # Indexes saved before these fields were stored lack them
+            if 'aspect_ratio' not in img:
+                width, height = img.get('width', 0), img.get('height', 0)
+                img['aspect_ratio'] = width / height if width > 0 and height > 0 else 1.0
+            if 'display_name' not in img:
+                img['display_name'] = ImageIndex.display_name(img.get('filename', ''))
+        self._by_id = by_id
+        self._by_hash = by_hash
+        self._next_id = max(by_id, default=0) + 1
+        self._total_bytes = sum(img.get('size_bytes', 0) for img in self.images)
+        self._format_counts = Counter(img['format'] for img in self.images if img.get('format'))
+    
+    @staticmethod
+    def display_name(filename: str) -> str:
+        """Shorten a filename to at most 20 characters for slide preview labels"""
+        return filename if len(filename) <= 20 else filename[:17] + "..."
+    
+    def clear(self):
+        """Remove every image from the index and save it"""
+        with self._lock:
+            self.images = []
+            self._rebuild_lookups()
+            self.save_index()
     
     def save_index(self):
-        """Save index to file"""
-        with open(self.index_file, 'w') as f:
-            json.dump(self.images, f, indent=2)
+        """
+        Save index to file.
+        
+        Inside bulk_update() the write is deferred until the outermost block
+        exits. The file is written to a temporary path and swapped in, so an
+        interrupted save never leaves a truncated index behind.
+        """
+        with self._lock:
+            if self._bulk_depth:
+                return
+            snapshot = self._snapshot()
+        self._write_snapshot(*snapshot)
     
-    def add_image(self, filepath: str, metadata: Optional[Dict] = None) -> Dict:
-        """Add an image to the index with metadata"""
+    def save_index_async(self):
+        """
+        Save index to file on a background thread.
+        
+        The index is serialized right away, so later changes are not
+        picked up by this save; only the write happens in the background.
+        Saves requested while a write is queued are coalesced into one
+        write of the newest snapshot.
+        """
+        with self._lock:
+            if self._bulk_depth:
+                return
+            snapshot = self._snapshot()
+        
+        with self._pending_lock:
+            self._pending_save = snapshot
+            if self._save_scheduled:
+                return
+            self._save_scheduled = True
+        self._save_executor.submit(self._flush_pending_save)
+    
+    def _flush_pending_save(self):
+        """Write queued snapshots until none is left (runs on the save thread)"""
+        while True:
+            with self._pending_lock:
+                snapshot = self._pending_save
+                self._pending_save = None
+                if snapshot is None:
+                    self._save_scheduled = False
+                    return
+            self._write_snapshot(*snapshot)
+    
+    def _snapshot(self) -> Tuple[int, bytes]:
+        """Serialize the index; caller must hold self._lock"""
+        self._save_seq += 1
+        return self._save_seq, _dumps_index(self.images)
+    
+    def _write_snapshot(self, seq: int, data: bytes):
+        """Atomically write a serialized index unless a newer one is already saved"""
+        with self._write_lock:
+            if seq <= self._written_seq:
+                return
+            tmp_file = self.index_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.index_file)
+            self._written_seq = seq
+    
+    @contextmanager
+    def bulk_update(self, save_async: bool = False):
+        """
+        Group several index changes into a single save.
+        
+        Usage:
+            with index.bulk_update():
+                for img in images:
+                    img['metadata']['identifier'] = 'SE'
+        
+        The index is saved once when the outermost block exits, in the
+        background if that block passed save_async=True.
+        """
+        with self._lock:
+            self._bulk_depth += 1
+            try:
+                yield self
+            finally:
+                self._bulk_depth -= 1
+                if self._bulk_depth == 0:
+                    if save_async:
+                        self.save_index_async()
+                    else:
+                        self.save_index()
+    
+    def add_image(self, filepath: str, metadata: Optional[Dict] = None, save: bool = True) -> Dict:
+        """
+        Add an image to the index with metadata.
+        
+        With save=False the index is not written; the caller saves once
+        after adding a batch of images (e.g. from several upload threads).
+        """
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"Image file not found: {filepath}")
         
-        # Get image information
+        # Calculate file hash for uniqueness; re-uploads of indexed files
+        # (common when a folder is added again) return before PIL reads
+        # the image header
+        file_hash = self._calculate_hash(filepath)
+        existing = self._find_by_hash(file_hash)
+        if existing is not None:
+            return existing
+        
+        # Get image information (Image.open only parses the header)
         try:
             with Image.open(filepath) as img:
                 width, height = img.size
@@ -250,14 +547,6 @@ class ImageIndex:
         except Exception as e:
             raise ValueError(f"Error reading image: {e}")
         
-        # Calculate file hash for uniqueness
-        file_hash = self._calculate_hash(filepath)
-        
-        # Check if image already indexed
-        for img in self.images:
-            if img['hash'] == file_hash:
-                return img
-        
         # Extract identifier and numerical prefix from filename
         filename = os.path.basename(filepath)
         numerical_prefix, identifier, full_match = ImageIdentifier.extract_identifier_and_number(filename)
@@ -268,39 +557,64 @@ class ImageIndex:
         combined_metadata['numerical_prefix'] = numerical_prefix
         combined_metadata['identifier_match'] = full_match
         
-        # Create image entry
-        image_entry = {
-            'id': len(self.images) + 1,
-            'filename': filename,
-            'filepath': os.path.abspath(filepath),
-            'hash': file_hash,
-            'format': format_type,
-            'mode': mode,
-            'width': width,
-            'height': height,
-            'size_bytes': os.path.getsize(filepath),
-            'added_date': datetime.now().isoformat(),
-            'metadata': combined_metadata
-        }
-        
-        self.images.append(image_entry)
-        self.save_index()
-        return image_entry
+        with self._lock:
+            # Check again: another upload thread may have added the same
+            # file since the check above
+            existing = self._find_by_hash(file_hash)
+            if existing is not None:
+                return existing
+            
+            # Create image entry (IDs are never reused, even after removals)
+            image_entry = {
+                'id': self._next_id,
+                'filename': filename,
+                'display_name': self.display_name(filename),
+                'filepath': os.path.abspath(filepath),
+                'hash': file_hash,
+                'format': format_type,
+                'mode': mode,
+                'width': width,
+                'height': height,
+                'aspect_ratio': width / height if height > 0 else 1.0,
+                'size_bytes': os.path.getsize(filepath),
+                'added_date': datetime.now().isoformat(),
+                'metadata': combined_metadata
+            }
+            
+            self.images.append(image_entry)
+            self._by_id[image_entry['id']] = image_entry
+            self._by_hash[file_hash] = image_entry
+            self._next_id += 1
+            self._total_bytes += image_entry['size_bytes']
+            self._format_counts[format_type] += 1
+            if save:
+                self.save_index()
+            return image_entry
+    
+    def _find_by_hash(self, file_hash: str) -> Optional[Dict]:
+        """Return the indexed image with this file hash, if any"""
+        with self._lock:
+            return self._by_hash.get(file_hash)
     
     def _calculate_hash(self, filepath: str) -> str:
         """Calculate SHA256 hash of file"""
+        # SHA-256 stays the algorithm: existing indexes store these digests
+        # for duplicate detection. Read into one reused buffer, unbuffered,
+        # so each chunk is copied once; update() releases the GIL meanwhile
         sha256_hash = hashlib.sha256()
-        with open(filepath, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
+        buffer = bytearray(self.HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        with open(filepath, "rb", buffering=0) as f:
+            while True:
+                size = f.readinto(buffer)
+                if not size:
+                    break
+                sha256_hash.update(view[:size])
         return sha256_hash.hexdigest()
     
     def get_image(self, image_id: int) -> Optional[Dict]:
         """Retrieve image by ID"""
-        for img in self.images:
-            if img['id'] == image_id:
-                return img
-        return None
+        return self._by_id.get(image_id)
     
     def get_all_images(self) -> List[Dict]:
         """Get all indexed images, sorted by group and identifier"""
@@ -352,12 +666,34 @@ class ImageIndex:
     
     def remove_image(self, image_id: int) -> bool:
         """Remove image from index"""
-        for i, img in enumerate(self.images):
-            if img['id'] == image_id:
-                self.images.pop(i)
-                self.save_index()
-                return True
-        return False
+        with self._lock:
+            target = self._by_id.pop(image_id, None)
+            if target is None:
+                return False
+            for i, img in enumerate(self.images):
+                if img is target:
+                    self.images.pop(i)
+                    break
+            self._total_bytes -= target.get('size_bytes', 0)
+            format_type = target.get('format')
+            if format_type in self._format_counts:
+                self._format_counts[format_type] -= 1
+                if not self._format_counts[format_type]:
+                    del self._format_counts[format_type]
+            # Expose any other entry that shared this ID or hash in an older index
+            for img in self.images:
+                if img.get('id') == image_id:
+                    self._by_id[image_id] = img
+                    break
+            target_hash = target.get('hash')
+            if target_hash is not None and self._by_hash.get(target_hash) is target:
+                del self._by_hash[target_hash]
+                for img in self.images:
+                    if img.get('hash') == target_hash:
+                        self._by_hash[target_hash] = img
+                        break
+            self.save_index()
+            return True
     
     def search_images(self, query: str) -> List[Dict]:
         """Search images by filename or metadata"""
@@ -370,7 +706,7 @@ class ImageIndex:
         return results
     
     def get_stats(self) -> Dict:
-        """Get statistics about indexed images"""
+        """Get statistics about indexed images (from running totals, no scan)"""
         if not self.images:
             return {
                 'total_images': 0,
@@ -378,27 +714,23 @@ class ImageIndex:
                 'formats': {}
             }
         
-        total_size = sum(img['size_bytes'] for img in self.images)
-        formats = {}
-        for img in self.images:
-            fmt = img['format']
-            formats[fmt] = formats.get(fmt, 0) + 1
-        
         return {
             'total_images': len(self.images),
-            'total_size_mb': round(total_size / (1024 * 1024), 2),
-            'formats': formats
+            'total_size_mb': round(self._total_bytes / (1024 * 1024), 2),
+            'formats': dict(self._format_counts)
         }
 
 
 class ImageUploader:
     """Handles uploading and organizing images"""
     
-    SUPPORTED_FORMATS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp'}
+    SUPPORTED_FORMATS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp'})
     
     def __init__(self, upload_dir: str = "uploaded_images"):
         self.upload_dir = upload_dir
         self.index = ImageIndex()
+        # Serializes picking a free filename when uploads copy in parallel
+        self._copy_lock = threading.Lock()
         self._ensure_upload_dir()
     
     def _ensure_upload_dir(self):
@@ -407,11 +739,34 @@ class ImageUploader:
     
     def is_supported_format(self, filepath: str) -> bool:
         """Check if file format is supported"""
-        ext = Path(filepath).suffix.lower()
+        ext = os.path.splitext(filepath)[1].lower()
         return ext in self.SUPPORTED_FORMATS
     
+    def scan_folder(self, folder_path: str) -> Iterator[str]:
+        """
+        Yield paths of supported image files under folder_path, recursively.
+        
+        Uses os.scandir so file types come from the directory listing instead
+        of a stat per entry. Like os.walk, symlinked directories are not followed.
+        """
+        supported = self.SUPPORTED_FORMATS
+        pending = [folder_path]
+        while pending:
+            subdirs = []
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif os.path.splitext(entry.name)[1].lower() in supported and entry.is_file():
+                            yield entry.path
+            except OSError:
+                continue
+            # Visit subdirectories in listing order
+            pending.extend(reversed(subdirs))
+    
     def upload_image(self, filepath: str, copy_to_upload_dir: bool = False, 
-                    metadata: Optional[Dict] = None) -> Dict:
+                    metadata: Optional[Dict] = None, save: bool = True) -> Dict:
         """
         Upload and index an image
         
@@ -419,6 +774,7 @@ class ImageUploader:
             filepath: Path to the image file
             copy_to_upload_dir: If True, copy image to upload directory
             metadata: Optional metadata dictionary
+            save: If False, don't save the index; the caller saves it later
         
         Returns:
             Dictionary with image information
@@ -432,31 +788,38 @@ class ImageUploader:
             filename = os.path.basename(filepath)
             target_path = os.path.join(self.upload_dir, filename)
             
-            # Handle duplicate filenames
-            counter = 1
-            while os.path.exists(target_path):
-                name, ext = os.path.splitext(filename)
-                target_path = os.path.join(self.upload_dir, f"{name}_{counter}{ext}")
-                counter += 1
+            # Handle duplicate filenames; the empty placeholder reserves the
+            # name so a concurrent upload of the same filename picks another
+            with self._copy_lock:
+                counter = 1
+                while os.path.exists(target_path):
+                    name, ext = os.path.splitext(filename)
+                    target_path = os.path.join(self.upload_dir, f"{name}_{counter}{ext}")
+                    counter += 1
+                open(target_path, 'wb').close()
             
             # Copy file
-            import shutil
-            shutil.copy2(filepath, target_path)
+            try:
+                shutil.copy2(filepath, target_path)
+            except Exception:
+                os.remove(target_path)
+                raise
         
         # Add to index
-        return self.index.add_image(target_path, metadata)
+        return self.index.add_image(target_path, metadata, save=save)
     
     def upload_multiple_images(self, filepaths: List[str], 
                               copy_to_upload_dir: bool = False,
                               metadata: Optional[Dict] = None) -> List[Dict]:
         """Upload multiple images at once"""
         results = []
-        for filepath in filepaths:
-            try:
-                result = self.upload_image(filepath, copy_to_upload_dir, metadata)
-                results.append(result)
-            except Exception as e:
-                print(f"Error uploading {filepath}: {e}")
+        with self.index.bulk_update():
+            for filepath in filepaths:
+                try:
+                    result = self.upload_image(filepath, copy_to_upload_dir, metadata)
+                    results.append(result)
+                except Exception as e:
+                    print(f"Error uploading {filepath}: {e}")
         return results
     
     def list_images(self) -> List[Dict]:
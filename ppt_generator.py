@@ -4,11 +4,13 @@ Creates presentation slides from grouped images with optimized layout
 """
 
 import os
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from PIL import Image as PILImage
 import math
+from functools import lru_cache
+from image_uploader import ImageIdentifier
 
 
 class PowerPointGenerator:
@@ -44,7 +46,9 @@ class PowerPointGenerator:
         self.available_width = self.slide_width - self.margin_left - self.margin_right
         self.available_height = self.slide_height - self.margin_top - self.margin_bottom
     
-    def calculate_grid_layout(self, num_images: int) -> Tuple[int, int]:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def calculate_grid_layout(num_images: int) -> Tuple[int, int]:
         """
         Calculate optimal grid layout (rows, cols) for given number of images
         
@@ -142,7 +146,6 @@ class PowerPointGenerator:
                 return
             elif layout_type == 'mixed':
                 # Force mixed layout
-                from image_uploader import ImageIdentifier
                 spectrum_images = [img for img in images 
                                   if img.get('metadata', {}).get('identifier', '') == 'Spectrum' or 
                                   img.get('metadata', {}).get('identifier', '') in ImageIdentifier.SPECTRUM_IDENTIFIERS]
@@ -163,8 +166,6 @@ class PowerPointGenerator:
             # 'custom' and 'auto' fall through to default behavior
         
         # Default auto-detection behavior
-        from image_uploader import ImageIdentifier
-        
         spectrum_images = [img for img in images 
                           if img.get('metadata', {}).get('identifier', '') == 'Spectrum' or
                           img.get('metadata', {}).get('identifier', '') in ImageIdentifier.SPECTRUM_IDENTIFIERS]
@@ -193,8 +194,6 @@ class PowerPointGenerator:
             images: List of all image dictionaries for this group
             profile: Layout profile containing regions configuration
         """
-        from image_uploader import ImageIdentifier
-        
         # Get regions from profile
         regions = profile.get('regions', [])
         if not regions:
@@ -629,7 +628,8 @@ class PowerPointGenerator:
             except Exception as e:
                 print(f"Error adding image {img['filename']}: {e}")
     
-    def generate_presentation(self, output_path: str, groups_to_include: List[str] = None) -> bool:
+    def generate_presentation(self, output_path: str, groups_to_include: List[str] = None,
+                              groups: Optional[Dict[str, List[Dict]]] = None) -> bool:
         """
         Generate PowerPoint presentation with one slide per group
         
@@ -637,41 +637,44 @@ class PowerPointGenerator:
             output_path: Path to save the presentation
             groups_to_include: Optional list of group labels to include (e.g., ["0001", "MAP1"])
                               If None, includes all groups
+            groups: Optional {group label: images} already built by the caller;
+                    if given, the index is not walked and regrouped
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            from image_uploader import ImageIdentifier
-            
             # Create presentation
             prs = Presentation()
             prs.slide_width = self.slide_width
             prs.slide_height = self.slide_height
             
-            # Get all images grouped
-            images = self.image_index.images
-            
-            # Group images by their formatted label
-            groups_dict = {}
-            for img in images:
-                metadata = img.get('metadata', {})
-                numerical_prefix = metadata.get('numerical_prefix')
-                identifier = metadata.get('identifier')
-                
-                if not numerical_prefix:
-                    continue  # Skip ungrouped images
-                
-                # Format group label
-                group_label = ImageIdentifier.format_group_label(numerical_prefix, identifier)
-                
-                # Filter by groups_to_include if specified
-                if groups_to_include and group_label not in groups_to_include:
-                    continue
-                
-                if group_label not in groups_dict:
-                    groups_dict[group_label] = []
-                groups_dict[group_label].append(img)
+            include = set(groups_to_include) if groups_to_include else None
+            
+            if groups is not None:
+                groups_dict = {label: group_images for label, group_images in groups.items()
+                               if include is None or label in include}
+            else:
+                # Group all images by their formatted label
+                groups_dict = {}
+                for img in self.image_index.images:
+                    metadata = img.get('metadata', {})
+                    numerical_prefix = metadata.get('numerical_prefix')
+                    identifier = metadata.get('identifier')
+                    
+                    if not numerical_prefix:
+                        continue  # Skip ungrouped images
+                    
+                    # Format group label
+                    group_label = ImageIdentifier.format_group_label(numerical_prefix, identifier)
+                    
+                    # Filter by groups_to_include if specified
+                    if include is not None and group_label not in include:
+                        continue
+                    
+                    if group_label not in groups_dict:
+                        groups_dict[group_label] = []
+                    groups_dict[group_label].append(img)
             
             # Sort groups
             sorted_groups = sorted(groups_dict.keys())